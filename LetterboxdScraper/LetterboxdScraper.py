@@ -1,15 +1,130 @@
+import os
 import requests
-import json
-from bs4 import BeautifulSoup
+import httpx
+import orjson
+import re
+import lxml.html
+from lxml import etree
 import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import random
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+logger = logging.getLogger(__name__)
+
+# Upper bound on pages fetched in parallel, to stay polite with Letterboxd
+MAX_CONCURRENT_PAGES = 5
+
+# Adaptive page pacing: delay bounds (seconds) after a 429, and how many clean
+# responses it takes to halve the delay again
+MIN_PAGE_DELAY = 1.0
+MAX_PAGE_DELAY = 30.0
+PACE_RECOVERY_RESPONSES = 5
+
+# Upper bound on add/remove requests in flight for the bulk helpers
+MAX_CONCURRENT_WRITES = 8
+
+# Pages kept per scraper for conditional GETs, least recently used dropped first
+PAGE_CACHE_SIZE = 64
+
+# Backend for scrapers that don't pick one: LETTERBOXD_HTTP2=1 switches every
+# scraper the app builds to the HTTP/2 httpx client
+HTTP2_DEFAULT = os.getenv("LETTERBOXD_HTTP2", "").lower() in ("1", "true", "yes")
+
+# Headers sent with every request; HTML GETs only add a Referer on top
+_SESSION_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+}
+
+# Per-request headers for the AJAX endpoints (login, add to list)
+_JSON_POST_HEADERS = {
+    "Accept": "application/json, text/javascript, */*; q=0.01",
+    "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
+    "X-Requested-With": "XMLHttpRequest",
+    "Origin": "https://letterboxd.com",
+    "Referer": "https://letterboxd.com/",
+}
+
+# Per-request headers for plain form posts (remove from list); Referer is added per call
+_FORM_POST_HEADERS = {
+    "Accept": "*/*",
+    "Content-Type": "application/x-www-form-urlencoded",
+    "Origin": "https://letterboxd.com",
+}
+
+# Strips HTML tags from the messages returned by add/remove endpoints
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# Strips the "film"/"films" suffix and non-breaking spaces from list film counts
+_FILMS_RE = re.compile(r'\xa0|\s*films?\b', re.I)
+
+
+def _has_class(name):
+    """XPath predicate matching elements whose class attribute contains `name`"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Compiled once so per-page parsing is only C-level tree traversal
+_POSTER_ITEMS_XP = etree.XPath(f"//li[{_has_class('posteritem')}]")
+_REACT_COMPONENT_XP = etree.XPath(f".//div[{_has_class('react-component')}]")
+_NEXT_LINK_XP = etree.XPath(f"//a[{_has_class('next')}]")
+_PAGINATOR_PAGES_XP = etree.XPath(f"//div[{_has_class('paginate-pages')}]//li")
+_LIST_ARTICLES_XP = etree.XPath(f"//article[{_has_class('list-summary')}]")
+_LIST_NAME_LINK_XP = etree.XPath(f".//h2[{_has_class('name')}]//a")
+_LIST_FILM_COUNT_XP = etree.XPath(f".//div[{_has_class('content-reactions-strip')}]//span[{_has_class('value')}]")
+_LIST_NOTES_XP = etree.XPath(f".//div[{_has_class('notes')}]")
+
+
+# lxml parsers must not be shared between threads, and pages are parsed from a pool
+_parser_local = threading.local()
+
+
+def _html_parser():
+    """Return this thread's UTF-8 HTML parser"""
+    parser = getattr(_parser_local, 'parser', None)
+    if parser is None:
+        parser = _parser_local.parser = lxml.html.HTMLParser(encoding='utf-8')
+    return parser
+
+
+def _text(element):
+    """Concatenated, stripped text of an element (like BeautifulSoup's get_text(strip=True))"""
+    return ''.join(piece.strip() for piece in element.itertext())
+
+
+def _retry_after_seconds(response):
+    """Return the delay requested by a Retry-After header in seconds, or None"""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    # Retry-After may also be an HTTP date
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
 
 class LetterboxdScraper:
-    def __init__(self, username, password, list_url, verify_ssl=False):
+    def __init__(self, username, password, list_url, verify_ssl=False, http2=None, session=None):
         """
         Initialize the Letterboxd scraper.
 
@@ -18,39 +133,127 @@ class LetterboxdScraper:
             password (str): Letterboxd password
             list_url (str): Full URL of the list to scrape (e.g., https://letterboxd.com/user/list/name/)
             verify_ssl (bool): Whether to verify SSL certificates (default: False)
+            http2 (bool): Use an HTTP/2 httpx client instead of requests (default: HTTP2_DEFAULT)
+            session: Existing client to send requests through, e.g. one that is already logged in
         """
-        self.session = requests.Session()
+        self.http2 = HTTP2_DEFAULT if http2 is None else http2
+        self.session = session if session is not None else self._create_session(verify_ssl, self.http2)
+
         self.username = username
         self.password = password
         self.list_url = list_url.rstrip('/')  # Remove trailing slash if present
         self.verify_ssl = verify_ssl
 
+        # List slug from URLs like https://letterboxd.com/fosanz/list/pendienteeees
+        self._list_name = self.list_url.rpartition('/list/')[2].partition('/')[0]
+
+        # CSRF token captured at login, reused by add/remove requests
+        self._csrf = None
+
+        # Adaptive delay between page requests, see _record_response
+        self._pace_lock = threading.Lock()
+        self._page_delay = 0.0
+        self._clean_responses = 0
+
+        # Conditional GET cache: page URL -> (etag, last_modified, (items, has_next, last_page)),
+        # shared with the scrapers for_list derives from this one
+        self._page_cache = OrderedDict()
+        self._page_cache_lock = threading.Lock()
+
+
+    @staticmethod
+    def _create_session(verify_ssl, http2):
+        """Build the HTTP client every request of this scraper goes through"""
+        if http2:
+            # One multiplexed HTTP/2 connection carries the concurrent page fetches.
+            # httpx only retries failed connects; 429s are handled by the login
+            # retry loop and _record_response.
+            transport = httpx.HTTPTransport(
+                http2=True,
+                verify=verify_ssl,
+                retries=3,
+                limits=httpx.Limits(max_connections=16, max_keepalive_connections=8)
+            )
+            return httpx.Client(
+                transport=transport,
+                headers=_SESSION_HEADERS,
+                follow_redirects=True,
+                timeout=30.0
+            )
+
+        session = requests.Session()
+
+        # Keep-alive pool sized for concurrent page fetches, with urllib3 retrying
+        # transient server errors on idempotent requests only: replaying the
+        # login or add/remove POSTs could apply them twice. 429s are left to the
+        # login backoff and _record_response pacing. raise_on_status=False hands
+        # the final response back so the status checks below still see it.
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=[500, 502, 503, 504],
+                allowed_methods=frozenset(["GET", "HEAD"]),
+                raise_on_status=False
+            )
+        )
+        session.mount("https://", adapter)
+        session.headers.update(_SESSION_HEADERS)
+        return session
+
+    def for_list(self, list_url):
+        """Return a scraper for another list that shares this scraper's logged-in session"""
+        scraper = LetterboxdScraper(
+            self.username, self.password, list_url,
+            verify_ssl=self.verify_ssl, http2=self.http2, session=self.session
+        )
+        scraper._csrf = self._csrf
+        # Keyed by page URL, so lists can share one cache; it then lives as
+        # long as the pooled parent rather than this per-request scraper
+        scraper._page_cache = self._page_cache
+        scraper._page_cache_lock = self._page_cache_lock
+        return scraper
+
+    def request(self, method, url, **kwargs):
+        """Send a request through the scraper's client, whichever backend it is"""
+        if not self.http2:
+            # httpx fixes verification on the transport; requests takes it per call
+            kwargs["verify"] = self.verify_ssl
+        return self.session.request(method, url, **kwargs)
+
+    def get_cookies(self):
+        """Return the session cookies as a plain name -> value dict"""
+        # httpx wraps its CookieJar, requests' jar is one
+        jar = getattr(self.session.cookies, "jar", self.session.cookies)
+        return {cookie.name: cookie.value for cookie in jar}
+
     def login(self):
         """Login to Letterboxd with rate limiting"""
         print("[*] Fetching homepage to get CSRF token...")
 
-        headers = {
-            "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        }
-
         max_retries = 3
-        base_delay = 5  # Start with 5 seconds
+        base_delay = 0.25  # Seconds, doubled on every retry
+        max_delay = 15
+        retry_after = None  # Set when the server tells us how long to back off
 
         for attempt in range(max_retries):
             try:
-                # Add random delay to avoid hitting rate limits
                 if attempt > 0:
-                    delay = base_delay * (2 ** attempt) + random.uniform(1, 3)
-                    print(f"[*] Rate limited, waiting {delay:.1f} seconds before retry {attempt + 1}/{max_retries}...")
+                    if retry_after is not None:
+                        delay = retry_after + random.uniform(0, base_delay)
+                    else:
+                        # Full jitter keeps concurrent clients from retrying in lockstep
+                        delay = random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+                    retry_after = None
+                    print(f"[*] Waiting {delay:.1f} seconds before retry {attempt + 1}/{max_retries}...")
                     time.sleep(delay)
 
-                response = self.session.get(
-                    "https://letterboxd.com/",
-                    headers=headers,
-                    verify=self.verify_ssl
-                )
+                response = self.request("GET", "https://letterboxd.com/")
 
                 if response.status_code == 429:
+                    retry_after = _retry_after_seconds(response)
                     print(f"[-] Rate limited (429) on attempt {attempt + 1}")
                     continue
 
@@ -76,28 +279,20 @@ class LetterboxdScraper:
                 "password": self.password
             }
 
-            login_headers = {
-                "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-                "Accept": "application/json, text/javascript, */*; q=0.01",
-                "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
-                "X-Requested-With": "XMLHttpRequest",
-                "Origin": "https://letterboxd.com",
-                "Referer": "https://letterboxd.com/",
-            }
-
             print("[*] Sending login request...")
             try:
                 # Add small delay before login request
                 time.sleep(random.uniform(1, 2))
 
-                login_response = self.session.post(
+                login_response = self.request(
+                    "POST",
                     "https://letterboxd.com/user/login.do",
                     data=login_data,
-                    headers=login_headers,
-                    verify=self.verify_ssl
+                    headers=_JSON_POST_HEADERS
                 )
 
                 if login_response.status_code == 429:
+                    retry_after = _retry_after_seconds(login_response)
                     print(f"[-] Login rate limited (429) on attempt {attempt + 1}")
                     continue
 
@@ -109,11 +304,12 @@ class LetterboxdScraper:
 
             if login_response.status_code == 200:
                 try:
-                    response_json = login_response.json()
+                    response_json = orjson.loads(login_response.content)
                     result = response_json.get("result")
 
                     if result == "success":
                         print("[+] Login successful!")
+                        self._csrf = csrf_token
                         return True
                     elif result == "error":
                         # Login failed - check if it's a credential error or retryable error
@@ -153,7 +349,7 @@ class LetterboxdScraper:
                             return False
                         continue
 
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     print("[-] Could not parse login response")
                     if attempt == max_retries - 1:
                         return False
@@ -165,52 +361,195 @@ class LetterboxdScraper:
         print("[-] All login attempts failed")
         return False
 
-    def get_all_movies(self):
-        """Fetch and parse all movies from all pages"""
-        all_movies = []
-        page = 1
+    def _pace(self):
+        """Wait out the current page delay, if any, before the next page request"""
+        with self._pace_lock:
+            delay = self._page_delay
+        if delay:
+            time.sleep(delay)
 
-        while True:
-            if page == 1:
-                url = f"{self.list_url}/"
+    def _record_response(self, response):
+        """
+        Adapt the page delay to how the server is responding.
+
+        Pages are fetched back to back until Letterboxd answers 429. The delay
+        then jumps to the server's Retry-After (or doubles), and halves again
+        after every PACE_RECOVERY_RESPONSES clean responses.
+        """
+        with self._pace_lock:
+            if response.status_code == 429:
+                retry_after = _retry_after_seconds(response)
+                if retry_after is None:
+                    retry_after = max(MIN_PAGE_DELAY, self._page_delay * 2)
+                self._page_delay = min(MAX_PAGE_DELAY, retry_after)
+                self._clean_responses = 0
+                return
+
+            self._clean_responses += 1
+            if self._page_delay and self._clean_responses >= PACE_RECOVERY_RESPONSES:
+                self._page_delay /= 2
+                if self._page_delay < MIN_PAGE_DELAY / 4:
+                    self._page_delay = 0.0
+                self._clean_responses = 0
+
+    def _movies_page_url(self, page):
+        """URL of a given page of this scraper's list"""
+        if page == 1:
+            return f"{self.list_url}/"
+        return f"{self.list_url}/page/{page}/"
+
+    def _fetch_page(self, url, page, referer, parse_page):
+        """
+        Fetch a single HTML page and parse it.
+
+        Only the parse results are cached for revalidation, never the tree. A
+        URL is always parsed the same way (movie pages vs. list pages), so the
+        URL alone keys the cache.
+
+        Args:
+            url (str): Page URL
+            page (int): Page number, for log output
+            referer (str): Referer header
+            parse_page (callable): Maps the parsed page to an iterable of items
+
+        Returns:
+            tuple | None: (items, has_next, last_page), or None if the request failed
+        """
+        print(f"\n[*] Fetching page {page}...")
+
+        self._pace()
+
+        # Revalidate pages seen before so an unchanged one comes back as a bodiless 304
+        headers = {"Referer": referer}
+        with self._page_cache_lock:
+            cached = self._page_cache.get(url)
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        try:
+            response = self.request("GET", url, headers=headers)
+        except Exception as e:
+            print(f"[-] Failed to fetch page {page}: {e}")
+            return None
+
+        self._record_response(response)
+
+        if response.status_code == 304 and cached:
+            print(f"[*] Page {page} unchanged, reusing cached copy")
+            with self._page_cache_lock:
+                if url in self._page_cache:
+                    self._page_cache.move_to_end(url)
+            return cached[2]
+
+        if response.status_code != 200:
+            print(f"[-] Failed to fetch page {page}. Status: {response.status_code}")
+            return None
+
+        tree = self._parse_html(response.content)
+        result = (list(parse_page(tree)), bool(_NEXT_LINK_XP(tree)), self._discover_last_page(tree))
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        with self._page_cache_lock:
+            if etag or last_modified:
+                self._page_cache[url] = (etag, last_modified, result)
+                self._page_cache.move_to_end(url)
+                while len(self._page_cache) > PAGE_CACHE_SIZE:
+                    self._page_cache.popitem(last=False)
             else:
-                url = f"{self.list_url}/page/{page}/"
+                self._page_cache.pop(url, None)
 
-            print(f"\n[*] Fetching page {page}...")
+        return result
 
-            headers = {
-                "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-                "Referer": self.list_url,
-            }
+    def _crawl_pages(self, page_url, referer, parse_page, label, max_workers):
+        """
+        Fetch and parse every page of a paginated listing.
 
-            try:
-                response = self.session.get(url, headers=headers, verify=self.verify_ssl)
-            except Exception as e:
-                print(f"[-] Failed to fetch page {page}: {e}")
-                break
+        Page 1 is fetched alone. If its paginator exposes the last page number,
+        pages 2..N are then fetched concurrently in one go; otherwise they are
+        probed in windows of `max_workers`. Pages are consumed in order until
+        one is empty or has no next link.
+
+        Args:
+            page_url (callable): Maps a page number to its URL
+            referer (str): Referer header sent with every request
+            parse_page (callable): Maps a parsed page to an iterable of items
+            label (str): Item name used in log output (e.g. "movies")
+            max_workers (int): Maximum number of pages fetched at once
+
+        Returns:
+            list: Items from all pages, in page order
+        """
+        items = []
 
-            if response.status_code != 200:
-                print(f"[-] Failed to fetch page {page}. Status: {response.status_code}")
-                break
+        def consume(page, result):
+            """Collect a page's items; return False once the listing is exhausted"""
+            if result is None:
+                return False
 
-            movies_on_page = self.parse_movies(response.text)
+            page_items, has_next, _ = result
+            items.extend(page_items)
+            found = len(page_items)
 
-            if not movies_on_page:
-                print(f"[*] No movies found on page {page}. End of list.")
-                break
+            if not found:
+                print(f"[*] No {label} found on page {page}. End of list.")
+                return False
 
-            all_movies.extend(movies_on_page)
-            print(f"[+] Found {len(movies_on_page)} movies on page {page}")
+            print(f"[+] Found {found} {label} on page {page}")
 
-            if not self.has_next_page(response.text):
+            # The next link decides, not the item count: entries the parser skips
+            # would make a full page look like the last one
+            if not has_next:
                 print("[*] No next page found.")
-                break
+                return False
+
+            return True
+
+        first_page = self._fetch_page(page_url(1), 1, referer, parse_page)
+        if not consume(1, first_page):
+            return items
+
+        last_page = first_page[2]
+        page = 2
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            while True:
+                if last_page:
+                    end = last_page + 1
+                    last_page = None  # Fall back to probing if the paginator was stale
+                else:
+                    end = page + max_workers
+
+                pages = range(page, end)
+                results = pool.map(lambda p: self._fetch_page(page_url(p), p, referer, parse_page), pages)
 
-            page += 1
-            time.sleep(1)
+                for current, result in zip(pages, results):
+                    if not consume(current, result):
+                        return items
 
-        return all_movies
+                page = end
+
+    def get_all_movies(self, max_workers=MAX_CONCURRENT_PAGES):
+        """
+        Fetch and parse all movies from all pages.
+
+        Args:
+            max_workers (int): Maximum number of pages fetched concurrently
+
+        Returns:
+            list: Movies from every page of the list
+        """
+        return self._crawl_pages(
+            self._movies_page_url,
+            self.list_url,
+            self.iter_movies,
+            "movies",
+            max_workers
+        )
 
     def get_movies_by_page(self, page=1):
         """
@@ -222,53 +561,50 @@ class LetterboxdScraper:
         Returns:
             list: Movies from that specific page
         """
-        if page == 1:
-            url = f"{self.list_url}/"
-        else:
-            url = f"{self.list_url}/page/{page}/"
-
-        print(f"\n[*] Fetching page {page}...")
-
-        headers = {
-            "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-            "Referer": self.list_url,
-        }
-
-        try:
-            response = self.session.get(url, headers=headers, verify=self.verify_ssl)
-        except Exception as e:
-            print(f"[-] Failed to fetch page {page}: {e}")
+        result = self._fetch_page(self._movies_page_url(page), page, self.list_url, self.iter_movies)
+        if result is None:
             return []
 
-        if response.status_code != 200:
-            print(f"[-] Failed to fetch page {page}. Status: {response.status_code}")
-            return []
-
-        movies_on_page = self.parse_movies(response.text)
+        return list(result[0])
 
-        return movies_on_page
+    def _parse_html(self, html):
+        """Parse HTML into an lxml tree, or pass through an already-parsed one"""
+        if isinstance(html, lxml.html.HtmlElement):
+            return html
+        try:
+            if isinstance(html, bytes):
+                # Letterboxd always serves UTF-8, so skip charset detection
+                return lxml.html.document_fromstring(html, parser=_html_parser())
+            return lxml.html.document_fromstring(html)
+        except etree.ParserError:
+            # Empty body: hand back an empty document so lookups find nothing
+            return lxml.html.Element('html')
+
+    def _discover_last_page(self, tree):
+        """Read the total page count from the paginator, or None if there isn't one"""
+        page_numbers = [
+            int(text)
+            for text in (_text(li) for li in _PAGINATOR_PAGES_XP(tree))
+            if text.isdigit()
+        ]
+        return max(page_numbers) if page_numbers else None
 
     def has_next_page(self, html):
-        """Check if there's a next page button"""
-        soup = BeautifulSoup(html, 'html.parser')
-        next_button = soup.find('a', class_='next')
-        return next_button is not None
-
-    def parse_movies(self, html):
-        """Parse movie data from HTML"""
-        soup = BeautifulSoup(html, 'html.parser')
-        movies = []
+        """Check if there's a next page button (accepts raw HTML or a parsed tree)"""
+        return bool(_NEXT_LINK_XP(self._parse_html(html)))
 
-        poster_items = soup.find_all('li', class_='posteritem')
+    def iter_movies(self, html):
+        """Yield movie data from HTML one film at a time (accepts raw HTML or a parsed tree)"""
+        tree = self._parse_html(html)
 
-        for item in poster_items:
+        for item in _POSTER_ITEMS_XP(tree):
             try:
-                react_comp = item.find('div', class_='react-component')
+                react_comps = _REACT_COMPONENT_XP(item)
 
-                if not react_comp:
+                if not react_comps:
                     continue
 
+                react_comp = react_comps[0]
                 movie_data = {
                     'name': react_comp.get('data-item-name'),
                     'slug': react_comp.get('data-item-slug'),
@@ -279,14 +615,16 @@ class LetterboxdScraper:
                     'object_id': item.get('data-object-id')
                 }
 
-                movies.append(movie_data)
-                print(f"  ✓ {movie_data['name']} (Rating: {movie_data['rating']}/10)")
-
             except Exception as e:
-                print(f"  [!] Error parsing movie: {e}")
+                logger.warning("  [!] Error parsing movie: %s", e)
                 continue
 
-        return movies
+            logger.debug("  ✓ %s (Rating: %s/10)", movie_data['name'], movie_data['rating'])
+            yield movie_data
+
+    def parse_movies(self, html):
+        """Parse movie data from HTML (accepts raw HTML or a parsed tree)"""
+        return list(self.iter_movies(html))
 
     def display_movies(self, movies):
         """Display movies in a formatted table"""
@@ -314,7 +652,7 @@ class LetterboxdScraper:
         Returns:
             bool: True if successful, False otherwise
         """
-        csrf_token = self.session.cookies.get("com.xk72.webparts.csrf")
+        csrf_token = self._csrf or self.session.cookies.get("com.xk72.webparts.csrf")
         if not csrf_token:
             print("[-] No CSRF token available. Please login first.")
             return False
@@ -325,39 +663,29 @@ class LetterboxdScraper:
             "filmListId": list_id
         }
 
-        headers = {
-            "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36",
-            "Accept": "application/json, text/javascript, */*; q=0.01",
-            "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
-            "X-Requested-With": "XMLHttpRequest",
-            "Origin": "https://letterboxd.com",
-            "Referer": f"https://letterboxd.com/",
-        }
-
         try:
-            response = self.session.post(
+            response = self.request(
+                "POST",
                 "https://letterboxd.com/s/add-film-to-list",
                 data=data,
-                headers=headers,
-                verify=self.verify_ssl
+                headers=_JSON_POST_HEADERS
             )
 
             if response.status_code == 200:
                 try:
-                    response_json = response.json()
+                    response_json = orjson.loads(response.content)
                     if response_json.get("result") == True:
                         messages = response_json.get("messages", [])
                         if messages:
                             # Clean HTML tags from message
-                            import re
-                            clean_message = re.sub('<[^<]+?>', '', messages[0])
+                            clean_message = _TAG_RE.sub('', messages[0])
                             print(f"[+] {clean_message}")
                         return True
                     else:
                         error_codes = response_json.get("errorCodes", [])
                         print(f"[-] Failed to add movie: {error_codes}")
                         return False
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     print("[-] Could not parse response")
                     return False
             else:
@@ -380,7 +708,7 @@ class LetterboxdScraper:
         Returns:
             bool: True if successful, False otherwise
         """
-        csrf_token = self.session.cookies.get("com.xk72.webparts.csrf")
+        csrf_token = self._csrf or self.session.cookies.get("com.xk72.webparts.csrf")
         if not csrf_token:
             print("[-] No CSRF token available. Please login first.")
             return False
@@ -389,52 +717,40 @@ class LetterboxdScraper:
         if username is None:
             username = self.username
 
-        # Extract list name from self.list_url if not provided
+        # Fall back to the list name extracted from self.list_url
         if list_name is None:
-            # Extract from URL like https://letterboxd.com/fosanz/list/pendienteeees
-            try:
-                list_name = self.list_url.split('/list/')[-1].split('/')[0]
-            except (IndexError, AttributeError):
-                print("[-] Could not extract list name from URL")
-                return False
+            list_name = self._list_name
 
         data = {
             "__csrf": csrf_token,
             "filmId": film_id
         }
 
-        headers = {
-            "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36",
-            "Accept": "*/*",
-            "Content-Type": "application/x-www-form-urlencoded",
-            "Origin": "https://letterboxd.com",
-            "Referer": f"https://letterboxd.com/{username}/list/{list_name}/",
-        }
+        headers = dict(_FORM_POST_HEADERS, Referer=f"https://letterboxd.com/{username}/list/{list_name}/")
 
         try:
-            response = self.session.post(
+            response = self.request(
+                "POST",
                 f"https://letterboxd.com/{username}/list/{list_name}/remove-film/",
                 data=data,
-                headers=headers,
-                verify=self.verify_ssl
+                headers=headers
             )
 
             if response.status_code == 200:
                 try:
-                    response_json = response.json()
+                    response_json = orjson.loads(response.content)
                     if response_json.get("result") == True:
                         messages = response_json.get("messages", [])
                         if messages:
                             # Clean HTML tags from message
-                            import re
-                            clean_message = re.sub('<[^<]+?>', '', messages[0])
+                            clean_message = _TAG_RE.sub('', messages[0])
                             print(f"[+] {clean_message}")
                         return True
                     else:
                         error_codes = response_json.get("errorCodes", [])
                         print(f"[-] Failed to remove movie: {error_codes}")
                         return False
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     print("[-] Could not parse response")
                     return False
             else:
@@ -445,102 +761,98 @@ class LetterboxdScraper:
             print(f"[-] Failed to remove movie: {e}")
             return False
 
-    def get_all_lists(self, target_username=None):
+    def add_movies_bulk(self, pairs, max_workers=MAX_CONCURRENT_WRITES):
         """
-        Fetch and parse all lists from a user's profile.
+        Add several movies concurrently over the shared session.
 
         Args:
-            target_username (str, optional): Username to fetch lists from (defaults to self.username)
+            pairs (iterable): (film_id, list_id) tuples, as passed to add_movie
+            max_workers (int): Maximum number of requests in flight
 
         Returns:
-            list: List of dictionaries containing list information
+            list: add_movie results (bool), in the same order as `pairs`
         """
-        if target_username is None:
-            target_username = self.username
-
-        all_lists = []
-        page = 1
-
-        while True:
-            if page == 1:
-                url = f"https://letterboxd.com/{target_username}/lists/"
-            else:
-                url = f"https://letterboxd.com/{target_username}/lists/page/{page}/"
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(lambda pair: self.add_movie(*pair), pairs))
 
-            print(f"\n[*] Fetching lists page {page}...")
-
-            headers = {
-                "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-                "Referer": f"https://letterboxd.com/{target_username}/lists/",
-            }
-
-            try:
-                response = self.session.get(url, headers=headers, verify=self.verify_ssl)
-            except Exception as e:
-                print(f"[-] Failed to fetch page {page}: {e}")
-                break
+    def remove_movies_bulk(self, film_ids, max_workers=MAX_CONCURRENT_WRITES, username=None, list_name=None):
+        """
+        Remove several movies concurrently over the shared session.
 
-            if response.status_code != 200:
-                print(f"[-] Failed to fetch page {page}. Status: {response.status_code}")
-                break
+        Args:
+            film_ids (iterable): Letterboxd film IDs to remove
+            max_workers (int): Maximum number of requests in flight
+            username (str, optional): Passed through to remove_movie
+            list_name (str, optional): Passed through to remove_movie
 
-            lists_on_page = self.parse_lists(response.text, target_username)
+        Returns:
+            list: remove_movie results (bool), in the same order as `film_ids`
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(lambda film_id: self.remove_movie(film_id, username, list_name), film_ids))
 
-            if not lists_on_page:
-                print(f"[*] No lists found on page {page}. End of list.")
-                break
+    def get_all_lists(self, target_username=None, max_workers=MAX_CONCURRENT_PAGES):
+        """
+        Fetch and parse all lists from a user's profile.
 
-            all_lists.extend(lists_on_page)
-            print(f"[+] Found {len(lists_on_page)} lists on page {page}")
+        Args:
+            target_username (str, optional): Username to fetch lists from (defaults to self.username)
+            max_workers (int): Maximum number of pages fetched concurrently
 
-            if not self.has_next_page(response.text):
-                print("[*] No next page found.")
-                break
+        Returns:
+            list: List of dictionaries containing list information
+        """
+        if target_username is None:
+            target_username = self.username
 
-            page += 1
-            time.sleep(1)
+        def page_url(page):
+            if page == 1:
+                return f"https://letterboxd.com/{target_username}/lists/"
+            return f"https://letterboxd.com/{target_username}/lists/page/{page}/"
 
-        return all_lists
+        return self._crawl_pages(
+            page_url,
+            f"https://letterboxd.com/{target_username}/lists/",
+            lambda tree: self.parse_lists(tree, target_username),
+            "lists",
+            max_workers
+        )
 
     def parse_lists(self, html, username):
-        """Parse list data from HTML"""
-        soup = BeautifulSoup(html, 'html.parser')
+        """Parse list data from HTML (accepts raw HTML or a parsed tree)"""
+        tree = self._parse_html(html)
         lists = []
 
-        # Find all list articles
-        list_articles = soup.find_all('article', class_='list-summary')
-
-        for article in list_articles:
+        for article in _LIST_ARTICLES_XP(tree):
             try:
                 # Get list ID
                 list_id = article.get('data-film-list-id')
 
                 # Get list name and URL
-                name_link = article.find('h2', class_='name').find('a') if article.find('h2', class_='name') else None
-                if not name_link:
+                name_links = _LIST_NAME_LINK_XP(article)
+                if not name_links:
                     continue
 
-                list_name = name_link.get_text(strip=True)
+                name_link = name_links[0]
+                list_name = _text(name_link)
                 list_url = name_link.get('href')
 
                 # Extract list slug from URL
-                list_slug = list_url.split('/list/')[-1].rstrip('/') if '/list/' in list_url else ""
+                _, list_marker, list_tail = list_url.rpartition('/list/')
+                list_slug = list_tail.rstrip('/') if list_marker else ""
 
                 # Get film count
                 film_count = "0"
-                reactions_strip = article.find('div', class_='content-reactions-strip')
-                if reactions_strip:
-                    value_span = reactions_strip.find('span', class_='value')
-                    if value_span:
-                        film_count = value_span.get_text(strip=True).replace('films', '').replace('film', '').replace('\xa0', ' ').strip()
+                value_spans = _LIST_FILM_COUNT_XP(article)
+                if value_spans:
+                    film_count = _FILMS_RE.sub(' ', _text(value_spans[0])).strip()
 
                 # Get description
                 description = ""
-                notes_div = article.find('div', class_='notes')
-                if notes_div:
+                notes_divs = _LIST_NOTES_XP(article)
+                if notes_divs:
                     # Get text content, removing HTML tags
-                    description = notes_div.get_text(strip=True)
+                    description = _text(notes_divs[0])
                     # Limit description length
                     if len(description) > 150:
                         description = description[:147] + "..."
@@ -556,10 +868,10 @@ class LetterboxdScraper:
                 }
 
                 lists.append(list_data)
-                print(f"  ✓ {list_data['name']} ({list_data['film_count']} films)")
+                logger.debug("  ✓ %s (%s films)", list_data['name'], list_data['film_count'])
 
             except Exception as e:
-                print(f"  [!] Error parsing list: {e}")
+                logger.warning("  [!] Error parsing list: %s", e)
                 continue
 
         return lists
@@ -1,11 +1,13 @@
 """Main application file."""
 import reflex as rx
-from .pages.login import login_page
-from .pages.dashboard import dashboard_page
-from .pages.lists import lists_page
-from .pages.list_detail import list_detail_page
-from .pages.sync import sync_page
-from .pages.manage import manage_sync_page
+from .pages import (
+    login_page,
+    dashboard_page,
+    lists_page,
+    list_detail_page,
+    sync_page,
+    manage_sync_page,
+)
 from .states.manage_sync_state import ManageSyncState
 from .states.sync_state import SyncState
 from .states import ListsState
@@ -41,6 +43,7 @@ def index() -> rx.Component:
 app = rx.App(
     stylesheets=[
         "https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap",
+        "/app.css",
     ]
 )
 
@@ -48,7 +51,7 @@ app = rx.App(
 app.add_page(index, route="/")
 app.add_page(login_page, route="/login", on_load=AuthState.check_login_redirect)
 app.add_page(dashboard_page, route="/dashboard", on_load=AuthState.on_load)
-app.add_page(lists_page, route="/lists", on_load=[AuthState.on_load, ListsState.on_load, SyncState.refresh_shared_status])
+app.add_page(lists_page, route="/lists", on_load=[AuthState.on_load, ListsState.on_load])
 app.add_page(list_detail_page, route="/list/[list_id]", on_load=ListDetailState.on_load)
 app.add_page(sync_page, route="/sync", on_load=[AuthState.on_load, SyncState.load_sync_groups])
 app.add_page(manage_sync_page, route="/manage-sync/[sync_code]", on_load=ManageSyncState.on_load)
\ No newline at end of file
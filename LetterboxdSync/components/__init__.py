@@ -1,4 +1,12 @@
 """Components module."""
-from .navbar import navbar
+from .navbar import navbar, navbar_content
+from .loading import LOADING_FALLBACK, CHECKING_AUTH_FALLBACK, auth_checking_fallback, spinner_with_text
 
-__all__ = ["navbar"]
+__all__ = [
+    "navbar",
+    "navbar_content",
+    "LOADING_FALLBACK",
+    "CHECKING_AUTH_FALLBACK",
+    "auth_checking_fallback",
+    "spinner_with_text",
+]
@@ -0,0 +1,29 @@
+"""Loading fallback components."""
+import reflex as rx
+
+
+def spinner_with_text(message: str) -> rx.Component:
+    """Large spinner above a status message."""
+    return rx.vstack(
+        rx.spinner(size="3"),
+        rx.text(message, size="3"),
+        spacing="3",
+    )
+
+
+# Page fallbacks never depend on state, so every page shares one instance
+LOADING_FALLBACK = rx.center(
+    spinner_with_text("Loading..."),
+    min_height="85vh",
+)
+
+
+def auth_checking_fallback() -> rx.Component:
+    """Full-page spinner shown while a protected page checks the session."""
+    return rx.center(
+        spinner_with_text("Checking authentication..."),
+        min_height="85vh",
+    )
+
+
+CHECKING_AUTH_FALLBACK = auth_checking_fallback()
@@ -2,184 +2,204 @@
 import reflex as rx
 from ..states.auth_state import AuthState
 
+# (icon, label, href) for every page reachable from the navbar
+_NAV_LINKS = (
+    ("layout-dashboard", "Dashboard", "/dashboard"),
+    ("list", "My Lists", "/lists"),
+    ("refresh-cw", "My Sync Groups", "/sync"),
+)
 
-def navbar() -> rx.Component:
-    """Create navigation bar with responsive visibility."""
+# Responsive visibility classes, defined in assets/app.css
+_DESKTOP_ONLY = "nav-desktop-only"
+_DESKTOP_ONLY_TEXT = "nav-desktop-only-text"
+_MOBILE_ONLY = "nav-mobile-only"
+
+_NAVBAR_BOX_STYLE = {
+    "position": "sticky",
+    "top": "0",
+    "z_index": "1000",
+    "padding_x": "1rem",
+    "padding_y": "0.75rem",
+    "backdrop_filter": "blur(10px)",
+    "border_bottom": "1px solid var(--gray-5)",
+    "width": "100%",
+    "background": "var(--color-panel-translucent)",
+}
+
+
+def _nav_link(icon: str, label: str, href: str) -> rx.Component:
+    """Desktop navbar link button."""
+    return rx.link(
+        rx.button(
+            rx.hstack(
+                rx.icon(icon, size=16),
+                rx.text(label),
+                spacing="2",
+                align_items="center",  # ✅ vertically center icon + text
+            ),
+            variant="ghost",
+            size="2",
+            height="100%",  # ensures button fills navbar height
+            display="flex",
+            align_items="center",  # ✅ vertically center content inside button
+        ),
+        href=href,
+    )
+
+
+def desktop_nav_links() -> rx.Component:
+    """Desktop link buttons, hidden below md."""
+    return rx.hstack(
+        *[_nav_link(icon, label, href) for icon, label, href in _NAV_LINKS],
+        spacing="5",  # gap between buttons
+        class_name=_DESKTOP_ONLY,
+    )
+
+
+def _mobile_menu_item(icon: str, label: str, href: str) -> rx.Component:
+    """User menu entry standing in for a desktop link below md."""
+    return rx.menu.item(
+        rx.hstack(
+            rx.icon(icon, size=16),
+            rx.text(label),
+            spacing="2",
+        ),
+        on_click=rx.redirect(href),
+        class_name=_MOBILE_ONLY,
+    )
+
+
+def mobile_nav_items() -> rx.Component:
+    """User menu entries that replace the desktop links below md."""
+    return rx.fragment(
+        *[_mobile_menu_item(icon, label, href) for icon, label, href in _NAV_LINKS],
+        rx.menu.separator(class_name=_MOBILE_ONLY),
+    )
+
+
+def _navbar_shell(left: rx.Component, right: rx.Component) -> rx.Component:
+    """Sticky navbar frame; carries no state of its own."""
     return rx.box(
         rx.hstack(
-            # Left side — title + desktop links
-            rx.hstack(
-                # Title
-                rx.link(
-                    rx.heading(
-                        "📽️ LB Sync",
-                        size="5",
-                        white_space="nowrap",
-                    ),
-                    href=rx.cond(
-                        AuthState.is_authenticated,
-                        "/dashboard",
-                        "/",
+            left,
+            right,
+            justify="between",
+            align="center",
+            width="100%",
+        ),
+        **_NAVBAR_BOX_STYLE,
+    )
+
+
+def _auth_left(is_authenticated: rx.Var[bool]) -> rx.Component:
+    """Title and desktop links."""
+    return rx.hstack(
+        # Title
+        rx.link(
+            rx.heading(
+                "📽️ LB Sync",
+                size="5",
+                white_space="nowrap",
+            ),
+            href=rx.cond(
+                is_authenticated,
+                "/dashboard",
+                "/",
+            ),
+        ),
+
+        # Desktop links
+        rx.cond(
+            is_authenticated,
+            desktop_nav_links(),
+        ),
+        spacing="4",
+        align="center",
+    )
+
+
+def _auth_right(is_authenticated: rx.Var[bool], current_user: rx.Var[str]) -> rx.Component:
+    """User menu or login button."""
+    return rx.cond(
+        is_authenticated,
+        rx.menu.root(
+            rx.menu.trigger(
+                rx.button(
+                    rx.icon("user", size=18),
+                    rx.text(
+                        current_user,
+                        size="2",
+                        class_name=_DESKTOP_ONLY_TEXT,
                     ),
+                    variant="soft",
+                    size="2",
                 ),
-
-                # Desktop links
-                rx.cond(
-                    AuthState.is_authenticated,
+            ),
+            rx.menu.content(
+                # User info (always shown)
+                rx.menu.item(
                     rx.hstack(
-                        rx.link(
-                            rx.button(
-                                rx.hstack(
-                                    rx.icon("layout-dashboard", size=16),
-                                    rx.text("Dashboard"),
-                                    spacing="2",
-                                    align_items="center",  # ✅ vertically center icon + text
-                                ),
-                                variant="ghost",
-                                size="2",
-                                height="100%",  # ensures button fills navbar height
-                                display="flex",
-                                align_items="center",  # ✅ vertically center content inside button
-                            ),
-                            href="/dashboard",
-                        ),
-                        rx.link(
-                            rx.button(
-                                rx.hstack(
-                                    rx.icon("list", size=16),
-                                    rx.text("My Lists"),
-                                    spacing="2",
-                                    align_items="center",
-                                ),
-                                variant="ghost",
-                                size="2",
-                                height="100%",
-                                display="flex",
-                                align_items="center",
-                            ),
-                            href="/lists",
-                        ),
-                        rx.link(
-                            rx.button(
-                                rx.hstack(
-                                    rx.icon("refresh-cw", size=16),
-                                    rx.text("My Sync Groups"),
-                                    spacing="2",
-                                    align_items="center",
-                                ),
-                                variant="ghost",
-                                size="2",
-                                height="100%",
-                                display="flex",
-                                align_items="center",
-                            ),
-                            href="/sync",
-                        ),
-                        spacing="5",  # gap between buttons
-                        display=["none", "none", "flex", "flex"],
+                        rx.icon("user", size=16),
+                        rx.text(current_user),
+                        spacing="2",
                     ),
+                    disabled=True,
                 ),
-                spacing="4",
-                align="center",
-            ),
+                rx.menu.separator(),
 
-            # Right side — user menu & color mode toggle
-            rx.hstack(
-                rx.cond(
-                    AuthState.is_authenticated,
-                    rx.menu.root(
-                        rx.menu.trigger(
-                            rx.button(
-                                rx.icon("user", size=18),
-                                rx.text(
-                                    AuthState.current_user,
-                                    size="2",
-                                    display=["none", "none", "block", "block"],
-                                ),
-                                variant="soft",
-                                size="2",
-                            ),
-                        ),
-                        rx.menu.content(
-                            # User info (always shown)
-                            rx.menu.item(
-                                rx.hstack(
-                                    rx.icon("user", size=16),
-                                    rx.text(AuthState.current_user),
-                                    spacing="2",
-                                ),
-                                disabled=True,
-                            ),
-                            rx.menu.separator(),
-
-                            # ✅ Mobile-only menu items (visible below md)
-                            rx.menu.item(
-                                rx.hstack(
-                                    rx.icon("layout-dashboard", size=16),
-                                    rx.text("Dashboard"),
-                                    spacing="2",
-                                ),
-                                on_click=rx.redirect("/dashboard"),
-                                display=["block", "block", "none", "none"],
-                            ),
-                            rx.menu.item(
-                                rx.hstack(
-                                    rx.icon("list", size=16),
-                                    rx.text("My Lists"),
-                                    spacing="2",
-                                ),
-                                on_click=rx.redirect("/lists"),
-                                display=["block", "block", "none", "none"],
-                            ),
-                            rx.menu.item(
-                                rx.hstack(
-                                    rx.icon("refresh-cw", size=16),
-                                    rx.text("My Sync Groups"),
-                                    spacing="2",
-                                ),
-                                on_click=rx.redirect("/sync"),
-                                display=["block", "block", "none", "none"],
-                            ),
-                            rx.menu.separator(display=["block", "block", "none", "none"]),
-
-                            # Logout (always)
-                            rx.menu.item(
-                                rx.hstack(
-                                    rx.icon("log-out", size=16),
-                                    rx.text("Logout"),
-                                    spacing="2",
-                                ),
-                                on_click=AuthState.logout,
-                                color_scheme="red",
-                            ),
-                        ),
-                    ),
-                    # Not authenticated → Login button
-                    rx.link(
-                        rx.button(
-                            rx.icon("log-in", size=18),
-                            rx.text("Login", display=["none", "none", "block", "block"]),
-                            size="2",
-                        ),
-                        href="/login",
+                # ✅ Mobile-only menu items (visible below md)
+                mobile_nav_items(),
+
+                # Logout (always)
+                rx.menu.item(
+                    rx.hstack(
+                        rx.icon("log-out", size=16),
+                        rx.text("Logout"),
+                        spacing="2",
                     ),
+                    on_click=AuthState.logout,
+                    color_scheme="red",
                 ),
-                rx.color_mode.button(size="2"),
-                spacing="2",
-                align="center",
             ),
+        ),
+        # Not authenticated → Login button
+        rx.link(
+            rx.button(
+                rx.icon("log-in", size=18),
+                rx.text("Login", class_name=_DESKTOP_ONLY_TEXT),
+                size="2",
+            ),
+            href="/login",
+        ),
+    )
 
-            justify="between",
+
+@rx.memo
+def navbar_content(is_authenticated: rx.Var[bool], current_user: rx.Var[str]) -> rx.Component:
+    """Navigation bar with responsive visibility.
+
+    Memoized over the two auth values it shows, so pages only re-render it
+    when one of them changes.
+    """
+    return _navbar_shell(
+        # Left side — title + desktop links
+        _auth_left(is_authenticated=is_authenticated),
+        # Right side — user menu & color mode toggle
+        rx.hstack(
+            _auth_right(
+                is_authenticated=is_authenticated,
+                current_user=current_user,
+            ),
+            rx.color_mode.button(size="2"),
+            spacing="2",
             align="center",
-            width="100%",
         ),
-        position="sticky",
-        top="0",
-        z_index="1000",
-        padding_x="1rem",
-        padding_y="0.75rem",
-        backdrop_filter="blur(10px)",
-        border_bottom="1px solid var(--gray-5)",
-        width="100%",
-        background="var(--color-panel-translucent)",
+    )
+
+
+def navbar() -> rx.Component:
+    """Create the navigation bar bound to AuthState."""
+    return navbar_content(
+        is_authenticated=AuthState.is_authenticated,
+        current_user=AuthState.current_user,
     )
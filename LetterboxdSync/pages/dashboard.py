@@ -2,6 +2,46 @@
 import reflex as rx
 from ..states.auth_state import AuthState
 from ..components.navbar import navbar
+from ..components.loading import LOADING_FALLBACK
+
+
+def _dashboard_card(title: str, description: str, button_label: str, href: str) -> rx.Component:
+    """Static dashboard card linking to one section of the app."""
+    return rx.card(
+        rx.vstack(
+            rx.heading(title, size="5"),
+            rx.text(
+                description,
+                color_scheme="gray",
+            ),
+            rx.link(
+                rx.button(button_label, size="3", width="100%"),  # ✅ full width
+                href=href,
+                width="100%",  # ensures link container stretches too
+            ),
+            spacing="3",
+            align="start",
+            height="100%",
+            justify="between",
+        ),
+        width="100%",
+        height="100%",
+    )
+
+
+# The cards never depend on state, so they are built once at import
+_LISTS_CARD = _dashboard_card(
+    "📋 My Lists",
+    "View and manage your Letterboxd lists",
+    "Go to Lists",
+    "/lists",
+)
+_SYNC_CARD = _dashboard_card(
+    "🔄 Sync Groups",
+    "Manage your shared lists and sync groups",
+    "Manage Syncs",
+    "/sync",
+)
 
 
 def dashboard_page() -> rx.Component:
@@ -11,92 +51,47 @@ def dashboard_page() -> rx.Component:
         # Authenticated content
         rx.fragment(
             navbar(),
-            rx.center(
-                rx.container(
-                    rx.vstack(
-                        # Welcome header
-                        rx.heading(
-                            f"Welcome back, {AuthState.current_user}!",
-                            size="8",
-                            text_align="center",
-                            width="100%",
-                        ),
+            rx.container(
+                rx.vstack(
+                    # Welcome header
+                    rx.heading(
+                        # Static text nodes around the one state-bound child
+                        "Welcome back, ",
+                        AuthState.current_user,
+                        "!",
+                        size="8",
+                        text_align="center",
+                        width="100%",
+                    ),
 
-                        # Dashboard grid cards
-                        # Dashboard grid cards
-                        rx.grid(
-                            rx.card(
-                                rx.vstack(
-                                    rx.heading("📋 My Lists", size="5"),
-                                    rx.text(
-                                        "View and manage your Letterboxd lists",
-                                        color_scheme="gray",
-                                    ),
-                                    rx.link(
-                                        rx.button("Go to Lists", size="3", width="100%"),  # ✅ full width
-                                        href="/lists",
-                                        width="100%",  # ensures link container stretches too
-                                    ),
-                                    spacing="3",
-                                    align="start",
-                                    height="100%",
-                                    justify="between",
-                                ),
-                                width="100%",
-                                height="100%",
-                            ),
-                            rx.card(
-                                rx.vstack(
-                                    rx.heading("🔄 Sync Groups", size="5"),
-                                    rx.text(
-                                        "Manage your shared lists and sync groups",
-                                        color_scheme="gray",
-                                    ),
-                                    rx.link(
-                                        rx.button("Manage Syncs", size="3", width="100%"),  # ✅ full width
-                                        href="/sync",
-                                        width="100%",
-                                    ),
-                                    spacing="3",
-                                    align="start",
-                                    height="100%",
-                                    justify="between",
-                                ),
-                                width="100%",
-                                height="100%",
-                            ),
-                            # ✅ Responsive grid layout
-                            columns=rx.breakpoints(
-                                initial="1",
-                                sm="1",
-                                md="2",
-                                lg="2",
-                            ),
-                            gap="1.5rem",  # consistent spacing between cards
-                            width="100%",
-                            justify_items="center",
-                            align_items="stretch",  # cards same height
+                    # Dashboard grid cards
+                    rx.grid(
+                        _LISTS_CARD,
+                        _SYNC_CARD,
+                        # ✅ Responsive grid layout
+                        columns=rx.breakpoints(
+                            initial="1",
+                            sm="1",
+                            md="2",
+                            lg="2",
                         ),
-                        spacing="6",
-                        padding_y="2rem",
-                        width="100%",  # ensures vstack fills horizontally
-                        align="center",
+                        gap="1.5rem",  # consistent spacing between cards
+                        width="100%",
+                        justify_items="center",
+                        align_items="stretch",  # cards same height
                     ),
-                    # ✅ Responsive container
-                    width="100%",
-                    max_width="1400px",
-                    mx="auto",  # center container horizontally
-                    padding_x=["1rem", "2rem", "3rem"],  # responsive side padding
+                    spacing="6",
+                    padding_y="2rem",
+                    width="100%",  # ensures vstack fills horizontally
+                    align="center",
                 ),
+                # ✅ Responsive container
+                width="100%",
+                max_width="1400px",
+                mx="auto",  # center container horizontally
+                padding_x=["1rem", "2rem", "3rem"],  # responsive side padding
             ),
         ),
         # Fallback while checking authentication or redirecting
-        rx.center(
-            rx.vstack(
-                rx.spinner(size="3"),
-                rx.text("Loading...", size="3"),
-                spacing="3",
-            ),
-            min_height="85vh",
-        ),
+        LOADING_FALLBACK,
     )
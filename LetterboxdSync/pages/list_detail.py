@@ -3,29 +3,36 @@ import reflex as rx
 from ..states.auth_state import AuthState
 from ..states.list_detail_state import ListDetailState
 from ..components.navbar import navbar
+from ..components.loading import CHECKING_AUTH_FALLBACK, spinner_with_text
 
+# Shared layout props, built once instead of on every page build
+_GRID_COLUMNS = rx.breakpoints(initial="3", md="5")
+_DETAIL_PADDING_X = rx.breakpoints(initial="1rem", sm="2rem")
 
-def movie_list_item(movie) -> rx.Component:
-    """Individual movie list item component with rating fixed at bottom."""
+
+@rx.memo
+def movie_list_item(name: rx.Var[str], rating_label: rx.Var[str], has_rating: rx.Var[bool]) -> rx.Component:
+    """Individual movie list item component with rating fixed at bottom.
+
+    Memoized over primitive props, so React's shallow compare lets unchanged
+    cards skip re-rendering on unrelated state updates.
+    """
     return rx.card(
         rx.vstack(
             # Movie title at the top
             rx.heading(
-                movie["name"],
+                name,
                 size="2",
                 width="100%",
                 text_align="center",
                 no_of_lines=2,  # optional: prevents overflow
             ),
 
-            # Spacer pushes the badge to the bottom
-            rx.spacer(),
-
             # Rating badge fixed at bottom
             rx.cond(
-                (movie["rating"] != "") & (movie["rating"] != "None"),
+                has_rating,
                 rx.badge(
-                    f"⭐ {movie['rating']}/10",
+                    rating_label,
                     variant="soft",
                     color_scheme="yellow",
                     size="2",
@@ -41,34 +48,35 @@ def movie_list_item(movie) -> rx.Component:
         cursor="pointer",
         padding="1rem",
         height="100%",       # ensure consistent height for equal cards
+        class_name="movie-card",  # off-screen cards skip layout/paint, see app.css
     )
 
 
-def pagination_controls() -> rx.Component:
-    """Pagination controls component."""
+@rx.memo
+def pagination_controls(
+    page_label: rx.Var[str],
+    prev_disabled: rx.Var[bool],
+    next_disabled: rx.Var[bool],
+) -> rx.Component:
+    """Pagination controls component.
+
+    Memoized over its three props, so it only re-renders when one of them changes.
+    """
     return rx.hstack(
         rx.button(
             rx.icon("chevron-left"),
             on_click=ListDetailState.prev_page,
-            disabled=rx.cond(
-                ListDetailState.current_page == 1,
-                True,
-                ListDetailState.list_detail_loading,
-                ),
+            disabled=prev_disabled,
             variant="soft",
         ),
         rx.text(
-            f"Page {ListDetailState.current_page} of {ListDetailState.total_pages}",
+            page_label,
             size="3",
         ),
         rx.button(
             rx.icon("chevron-right"),
             on_click=ListDetailState.next_page,
-            disabled=rx.cond(
-                ~ListDetailState.has_more,
-                True,
-                ListDetailState.list_detail_loading,
-            ),
+            disabled=next_disabled,
             variant="soft",
         ),
         spacing="3",
@@ -78,119 +86,144 @@ def pagination_controls() -> rx.Component:
     )
 
 
+@rx.memo
+def results_count(summary: rx.Var[str]) -> rx.Component:
+    """Result count line; memoized over its one prop."""
+    return rx.text(
+        summary,
+        size="2",
+        color_scheme="gray",
+        text_align="center",
+        width="100%",
+    )
+
+
+def _movies_loading() -> rx.Component:
+    """Spinner shown while a list's first page is loading."""
+    return rx.center(
+        spinner_with_text("Loading movies..."),
+        min_height="40vh",
+        width="100%",
+    )
+
+
+@rx.memo
+def error_callout(message: rx.Var[str]) -> rx.Component:
+    """Callout showing an error message; memoized over the message."""
+    return rx.callout(
+        message,
+        icon="triangle_alert",
+        color_scheme="red",
+    )
+
+
+def _movies_empty() -> rx.Component:
+    """Shown when the list has no movies."""
+    return rx.center(
+        rx.vstack(
+            rx.icon("film", size=64, color="gray"),
+            rx.text("No movies found", size="4", color_scheme="gray"),
+            spacing="3",
+        ),
+        min_height="40vh",
+        width="100%",
+    )
+
+
+def _movies_grid() -> rx.Component:
+    """Movies grid with pagination, result count and paging errors."""
+    return rx.vstack(
+        # Movies list
+        rx.grid(
+            rx.foreach(
+                ListDetailState.visible_movies,
+                lambda movie: movie_list_item(
+                    name=movie["name"],
+                    rating_label=movie["rating_label"],
+                    has_rating=movie["has_rating"],
+                    key=movie["film_id"],
+                ),
+            ),
+            columns=_GRID_COLUMNS,
+            spacing="2",
+            width="100%",
+            class_name=rx.cond(
+                ListDetailState.list_detail_loading,
+                "movies-grid loading",
+                "movies-grid",
+            ),
+        ),
+
+        # Pagination controls
+        pagination_controls(
+            page_label=ListDetailState.page_label,
+            prev_disabled=ListDetailState.prev_disabled,
+            next_disabled=ListDetailState.next_disabled,
+        ),
+
+        # Results count
+        results_count(summary=ListDetailState.results_summary),
+
+        # Errors from paging while movies are shown
+        rx.cond(
+            ListDetailState.error_message != "",
+            error_callout(message=ListDetailState.error_message),
+        ),
+
+        spacing="4",
+        width="100%",
+    )
+
+
 def list_detail_page() -> rx.Component:
     """List detail page component."""
     return rx.cond(
         AuthState.is_authenticated,
         rx.fragment(
             navbar(),
-            rx.center(  # Center the entire container on the page
-                rx.container(
+            rx.container(
+                rx.vstack(
+                    # Header with back button and title
                     rx.vstack(
-                        # Header with back button and title
-                        rx.vstack(
-                            rx.hstack(
-                                rx.link(
-                                    rx.button(
-                                        rx.icon("arrow-left"),
-                                        "Back to Lists",
-                                        variant="soft",
-                                    ),
-                                    href="/lists",
+                        rx.hstack(
+                            rx.link(
+                                rx.button(
+                                    rx.icon("arrow-left"),
+                                    "Back to Lists",
+                                    variant="soft",
                                 ),
-                                width="100%",
+                                href="/lists",
                             ),
-                            rx.heading(
-                                ListDetailState.list_name,
-                                size="7",
-                                text_align="center",
-                                width="100%",
-                            ),
-                            spacing="3",
                             width="100%",
                         ),
-
-                        rx.cond(
-                            ListDetailState.list_detail_loading & (ListDetailState.current_page == 1),
-                            rx.center(
-                                rx.vstack(
-                                    rx.spinner(size="3"),
-                                    rx.text("Loading movies...", size="3"),
-                                    spacing="3",
-                                ),
-                                min_height="40vh",
-                                width="100%",
-                            ),
-                            rx.cond(
-                                ListDetailState.movies.length() > 0,
-                                rx.vstack(
-                                    # Movies list
-                                    rx.grid(
-                                        rx.foreach(
-                                            ListDetailState.movies,
-                                            movie_list_item,
-                                        ),
-                                        columns=rx.breakpoints(
-                                            initial="3",
-                                            md="5",
-                                        ),
-                                        spacing="2",
-                                        width="100%",
-                                    ),
-
-                                    # Pagination controls
-                                    pagination_controls(),
-
-                                    # Results count
-                                    rx.text(
-                                        f"Showing {ListDetailState.movies.length()} of {ListDetailState.total_count} movies",
-                                        size="2",
-                                        color_scheme="gray",
-                                        text_align="center",
-                                        width="100%",
-                                    ),
-
-                                    spacing="4",
-                                    width="100%",
-                                ),
-                                rx.center(
-                                    rx.vstack(
-                                        rx.icon("film", size=64, color="gray"),
-                                        rx.text("No movies found", size="4", color_scheme="gray"),
-                                        spacing="3",
-                                    ),
-                                    min_height="40vh",
-                                    width="100%",
-                                ),
-                                ),
-                            ),
-
-                        rx.cond(
-                            ListDetailState.error_message != "",
-                            rx.callout(
-                                ListDetailState.error_message,
-                                icon="triangle_alert",
-                                color_scheme="red",
-                            ),
-                            ),
-
-                        spacing="5",
+                        rx.heading(
+                            ListDetailState.list_name,
+                            size="7",
+                            text_align="center",
+                            width="100%",
+                        ),
+                        spacing="3",
                         width="100%",
-                        padding_y="2rem",
                     ),
-                    max_width="800px",
+
+                    # One body per view_state; the grid stays mounted while paging
+                    rx.match(
+                        ListDetailState.view_state,
+                        ("ready", _movies_grid()),
+                        ("loading", _movies_loading()),
+                        ("error", error_callout(message=ListDetailState.error_message)),
+                        _movies_empty(),
+                    ),
+
+                    spacing="5",
                     width="100%",
-                    padding_x=rx.breakpoints(initial="1rem", sm="2rem"),
+                    padding_y="2rem",
                 ),
-                width="100%",  # Make the center container take full width
-            ),
-        ),
-        rx.center(
-            rx.vstack(
-                rx.spinner(size="3"),
-                rx.text("Checking authentication...", size="3"),
-                spacing="3",
+                max_width="800px",
+                width="100%",
+                mx="auto",  # center container horizontally
+                padding_x=_DETAIL_PADDING_X,
             ),
-            min_height="85vh",
         ),
+        CHECKING_AUTH_FALLBACK,
     )
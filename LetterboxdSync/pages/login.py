@@ -19,38 +19,42 @@ def login_page() -> rx.Component:
                             color_scheme="gray",
                         ),
 
-                        rx.vstack(
-                            rx.input(
-                                placeholder="Letterboxd Username",
-                                value=AuthState.username,
-                                on_change=AuthState.set_username,
-                                size="3",
-                                width="100%"
-                            ),
-                            rx.input(
-                                placeholder="Password",
-                                type="password",
-                                value=AuthState.password,
-                                on_change=AuthState.set_password,
-                                size="3",
-                                width="100%"
-                            ),
-                            rx.button(
-                                rx.cond(
-                                    AuthState.auth_loading,
-                                    rx.hstack(
-                                        rx.spinner(size="2"),
-                                        rx.text("Connecting..."),
-                                        spacing="2",
+                        rx.form(
+                            rx.vstack(
+                                # Uncontrolled; values arrive with the submit, which
+                                # also covers autofill and pressing Enter
+                                rx.input(
+                                    placeholder="Letterboxd Username",
+                                    name="username",
+                                    size="3",
+                                    width="100%"
+                                ),
+                                rx.input(
+                                    placeholder="Password",
+                                    type="password",
+                                    name="password",
+                                    size="3",
+                                    width="100%"
+                                ),
+                                rx.button(
+                                    rx.cond(
+                                        AuthState.auth_loading,
+                                        rx.hstack(
+                                            rx.spinner(size="2"),
+                                            rx.text("Connecting..."),
+                                            spacing="2",
+                                        ),
+                                        "Login with Letterboxd"
                                     ),
-                                    "Login with Letterboxd"
+                                    type="submit",
+                                    disabled=AuthState.auth_loading,
+                                    width="100%",
+                                    size="3",
                                 ),
-                                on_click=AuthState.login,
-                                disabled=AuthState.auth_loading,
+                                spacing="3",
                                 width="100%",
-                                size="3",
                             ),
-                            spacing="3",
+                            on_submit=AuthState.login,
                             width="100%",
                         ),
 
@@ -3,16 +3,27 @@ import reflex as rx
 from ..states.auth_state import AuthState
 from ..states.manage_sync_state import ManageSyncState
 from ..components.navbar import navbar
+from ..components.loading import CHECKING_AUTH_FALLBACK
 
 
-def member_card(member) -> rx.Component:
-    """Individual member card component."""
+@rx.memo
+def member_card(
+    display_name: rx.Var[str],
+    is_master: rx.Var[str],
+    joined_at: rx.Var[str],
+    list_url: rx.Var[str],
+) -> rx.Component:
+    """Individual member card component.
+
+    Memoized over scalar props so members whose data didn't change skip
+    re-rendering on unrelated ManageSyncState updates.
+    """
     return rx.card(
         rx.vstack(
             rx.hstack(
-                rx.heading(member["display_name"], size="4"),
+                rx.heading(display_name, size="4"),
                 rx.cond(
-                    member["is_master"] == "True",
+                    is_master == "True",
                     rx.badge("Master", variant="solid", color_scheme="gold", size="2"),
                     rx.badge("Member", variant="soft", color_scheme="blue", size="2"),
                 ),
@@ -22,12 +33,12 @@ def member_card(member) -> rx.Component:
                 width="100%",
             ),
             rx.text(
-                f"Joined: {member['joined_at']}",
+                f"Joined: {joined_at}",
                 size="2",
                 color_scheme="gray",
             ),
             rx.text(
-                f"List: {member['list_url']}",
+                f"List: {list_url}",
                 size="2",
                 color_scheme="gray",
                 width="100%",
@@ -43,7 +54,8 @@ def member_card(member) -> rx.Component:
     )
 
 
-def unshare_confirmation_dialog() -> rx.Component:
+@rx.memo
+def unshare_confirmation_dialog(is_open: rx.Var[bool], is_loading: rx.Var[bool]) -> rx.Component:
     """Unshare confirmation dialog."""
     return rx.dialog.root(
         rx.dialog.content(
@@ -58,12 +70,12 @@ def unshare_confirmation_dialog() -> rx.Component:
                     ),
                     rx.button(
                         rx.cond(
-                            ManageSyncState.is_loading,
+                            is_loading,
                             rx.spinner(size="2"),
                             "Confirm Unshare",
                         ),
                         on_click=ManageSyncState.confirm_unshare,
-                        disabled=ManageSyncState.is_loading,
+                        disabled=is_loading,
                         color_scheme="red",
                     ),
                     spacing="2",
@@ -75,7 +87,7 @@ def unshare_confirmation_dialog() -> rx.Component:
             ),
             max_width="500px",
         ),
-        open=ManageSyncState.show_unshare_dialog,
+        open=is_open,
         on_open_change=ManageSyncState.hide_unshare_confirmation,
     )
 
@@ -86,11 +98,13 @@ def manage_sync_page() -> rx.Component:
         AuthState.is_authenticated,
         rx.fragment(
             navbar(),
-            unshare_confirmation_dialog(),
-            rx.script(
-                "if (window.location.pathname.includes('/manage-sync/')) { "
-                "const syncCode = window.location.pathname.split('/manage-sync/')[1]; "
-                "fetch('/api/load_sync_group/' + syncCode); }"
+            # Only mounted while open
+            rx.cond(
+                ManageSyncState.show_unshare_dialog,
+                unshare_confirmation_dialog(
+                    is_open=ManageSyncState.show_unshare_dialog,
+                    is_loading=ManageSyncState.is_loading,
+                ),
             ),
             rx.center(
                 rx.container(
@@ -114,7 +128,7 @@ def manage_sync_page() -> rx.Component:
                                 rx.vstack(
                                     rx.center(
                                         rx.heading(
-                                            ManageSyncState.group_info.get("group_name", "Loading..."),
+                                            ManageSyncState.group_name,
                                             size="7",
                                             text_align="center",
                                         ),
@@ -124,7 +138,7 @@ def manage_sync_page() -> rx.Component:
                                         rx.vstack(
                                             rx.text("Sync Code", size="2", color_scheme="gray"),
                                             rx.text(
-                                                ManageSyncState.group_info.get("sync_code", ""),
+                                                ManageSyncState.group_sync_code,
                                                 size="3",
                                                 font_weight="bold",
                                             ),
@@ -134,7 +148,7 @@ def manage_sync_page() -> rx.Component:
                                         rx.vstack(
                                             rx.text("Sync Mode", size="2", color_scheme="gray"),
                                             rx.text(
-                                                ManageSyncState.group_info.get("sync_mode", ""),
+                                                ManageSyncState.group_sync_mode,
                                                 size="3",
                                             ),
                                             align="center",
@@ -143,7 +157,7 @@ def manage_sync_page() -> rx.Component:
                                         rx.vstack(
                                             rx.text("Created", size="2", color_scheme="gray"),
                                             rx.text(
-                                                ManageSyncState.group_info.get("created_at", ""),
+                                                ManageSyncState.group_created_at,
                                                 size="3",
                                             ),
                                             align="center",
@@ -152,7 +166,7 @@ def manage_sync_page() -> rx.Component:
                                         rx.vstack(
                                             rx.text("Last Sync", size="2", color_scheme="gray"),
                                             rx.text(
-                                                ManageSyncState.group_info.get("last_sync", "Never"),
+                                                ManageSyncState.group_last_sync,
                                                 size="3",
                                             ),
                                             align="center",
@@ -176,8 +190,7 @@ def manage_sync_page() -> rx.Component:
                                                         spacing="1",
                                                     ),
                                                 ),
-                                                on_click=lambda: rx.redirect(
-                                                    f"/list/{ManageSyncState.group_info['id']}"),
+                                                on_click=rx.redirect(f"/list/{ManageSyncState.group_id}"),
                                                 disabled=ManageSyncState.is_loading,
                                                 color_scheme="blue",
                                                 size="3",
@@ -233,9 +246,18 @@ def manage_sync_page() -> rx.Component:
                         rx.vstack(
                             rx.heading("Group Members", size="5"),
                             rx.cond(
-                                ManageSyncState.group_members.length() > 0,
+                                ManageSyncState.has_members,
                                 rx.grid(
-                                    rx.foreach(ManageSyncState.group_members, member_card),
+                                    rx.foreach(
+                                        ManageSyncState.group_members,
+                                        lambda member: member_card(
+                                            display_name=member["display_name"],
+                                            is_master=member["is_master"],
+                                            joined_at=member["joined_at"],
+                                            list_url=member["list_url"],
+                                            key=member["id"],
+                                        ),
+                                    ),
                                     columns=rx.breakpoints(initial="1", sm="2"),
                                     gap="1rem",
                                     width="100%",
@@ -286,12 +308,5 @@ def manage_sync_page() -> rx.Component:
             ),
         ),
         # Fallback
-        rx.center(
-            rx.vstack(
-                rx.spinner(size="3"),
-                rx.text("Checking authentication...", size="3"),
-                spacing="3",
-            ),
-            min_height="85vh",
-        ),
+        CHECKING_AUTH_FALLBACK,
     )
@@ -3,16 +3,99 @@ import reflex as rx
 from ..states.auth_state import AuthState
 from ..states.sync_state import SyncState
 from ..components.navbar import navbar
+from ..components.loading import CHECKING_AUTH_FALLBACK
 
+# Shared layout props, built once instead of on every page build
+_GRID_COLUMNS = rx.breakpoints(initial="1", sm="1", md="2")
+_GRID_PADDING_X = ["1rem", "2rem", "3rem"]
 
-def sync_group_card(group) -> rx.Component:
-    """Individual sync group card component."""
+# Label/value column in a group card's stats grid
+_STAT_STYLE = {"align": "center", "spacing": "1"}
+
+# Static subtrees, built once at import
+_REFRESH_ICON = rx.icon("refresh-cw")
+_SETTINGS_ICON = rx.icon("settings")
+
+_HEADER = rx.vstack(
+    rx.center(
+        rx.heading("Sync Groups", size="7", text_align="center"),
+        width="100%",
+    ),
+    rx.center(
+        rx.text(
+            "Manage your shared Letterboxd lists",
+            size="3",
+            color_scheme="gray",
+            text_align="center",
+        ),
+        width="100%",
+    ),
+    spacing="2",
+    width="100%",
+)
+
+_EMPTY_STATE = rx.center(
+    rx.vstack(
+        rx.icon("users", size=64, color="gray"),
+        rx.text("No sync groups found", size="4", color_scheme="gray"),
+        rx.text(
+            "Share a list from the Lists page to create your first sync group",
+            size="2",
+            color_scheme="gray",
+            text_align="center",
+        ),
+        rx.link(
+            rx.button("Go to Lists", size="3"),
+            href="/lists",
+        ),
+        spacing="3",
+    ),
+    min_height="40vh",
+    width="100%",
+)
+
+
+@rx.memo
+def sync_now_button(group_id: rx.Var[str]) -> rx.Component:
+    """Sync Now button; the only part of a group card that reads sync_loading."""
+    return rx.button(
+        rx.cond(
+            SyncState.sync_loading,
+            rx.spinner(size="2"),
+            rx.hstack(
+                _REFRESH_ICON,
+                rx.text("Sync Now"),
+                spacing="1",
+            ),
+        ),
+        on_click=SyncState.sync_group_now(group_id),
+        disabled=SyncState.sync_loading,
+        size="2",
+        color_scheme="green",
+        flex="1",
+    )
+
+
+@rx.memo
+def sync_group_card(
+    group_id: rx.Var[str],
+    group_name: rx.Var[str],
+    sync_code: rx.Var[str],
+    member_count: rx.Var[str],
+    sync_mode: rx.Var[str],
+    last_sync: rx.Var[str],
+) -> rx.Component:
+    """Individual sync group card component.
+
+    Memoized over the group's fields, so loading and message changes only
+    re-render the Sync Now button.
+    """
     return rx.card(
         rx.vstack(
             rx.hstack(
-                rx.heading(group["group_name"], size="4"),
+                rx.heading(group_name, size="4"),
                 rx.badge(
-                    group["sync_code"],
+                    sync_code,
                     variant="soft",
                     color_scheme="blue",
                     size="2",
@@ -25,21 +108,18 @@ def sync_group_card(group) -> rx.Component:
             rx.grid(
                 rx.vstack(
                     rx.text("Members", size="2", color_scheme="gray"),
-                    rx.text(group['member_count'], size="3"),
-                    align="center",
-                    spacing="1",
+                    rx.text(member_count, size="3"),
+                    **_STAT_STYLE,
                 ),
                 rx.vstack(
                     rx.text("Mode", size="2", color_scheme="gray"),
-                    rx.text(group['sync_mode'], size="3"),
-                    align="center",
-                    spacing="1",
+                    rx.text(sync_mode, size="3"),
+                    **_STAT_STYLE,
                 ),
                 rx.vstack(
                     rx.text("Last Sync", size="2", color_scheme="gray"),
-                    rx.text(group['last_sync'], size="3"),
-                    align="center",
-                    spacing="1",
+                    rx.text(last_sync, size="3"),
+                    **_STAT_STYLE,
                 ),
                 columns="3",
                 spacing="3",
@@ -47,29 +127,14 @@ def sync_group_card(group) -> rx.Component:
             ),
 
             rx.hstack(
-                rx.button(
-                    rx.cond(
-                        SyncState.is_loading,
-                        rx.spinner(size="2"),
-                        rx.hstack(
-                            rx.icon("refresh-cw"),
-                            rx.text("Sync Now"),
-                            spacing="1",
-                        ),
-                    ),
-                    on_click=lambda: SyncState.sync_group_now(group["id"]),
-                    disabled=SyncState.is_loading,
-                    size="2",
-                    color_scheme="green",
-                    flex="1",
-                ),
+                sync_now_button(group_id=group_id),
                 rx.button(
                     rx.hstack(
-                        rx.icon("settings"),
+                        _SETTINGS_ICON,
                         rx.text("Manage"),
                         spacing="1",
                     ),
-                    on_click=lambda: rx.redirect(f"/manage-sync/{group['sync_code']}"),
+                    on_click=rx.redirect(f"/manage-sync/{sync_code}"),
                     size="2",
                     variant="outline",
                     flex="1",
@@ -98,56 +163,29 @@ def sync_page() -> rx.Component:
                 rx.container(
                     rx.vstack(
                         # Header
-                        rx.vstack(
-                            rx.center(
-                                rx.heading("Sync Groups", size="7", text_align="center"),
-                                width="100%",
-                            ),
-                            rx.center(
-                                rx.text(
-                                    "Manage your shared Letterboxd lists",
-                                    size="3",
-                                    color_scheme="gray",
-                                    text_align="center",
-                                ),
-                                width="100%",
-                            ),
-                            spacing="2",
-                            width="100%",
-                        ),
+                        _HEADER,
 
                         # Content
                         rx.cond(
-                            SyncState.sync_groups.length() > 0,
+                            SyncState.has_sync_groups,
                             rx.grid(
-                                rx.foreach(SyncState.sync_groups, sync_group_card),
-                                columns=rx.breakpoints(
-                                    initial="1",
-                                    sm="1",
-                                    md="2",
-                                ),
-                                gap="1.5rem",
-                                width="100%",
-                            ),
-                            rx.center(
-                                rx.vstack(
-                                    rx.icon("users", size=64, color="gray"),
-                                    rx.text("No sync groups found", size="4", color_scheme="gray"),
-                                    rx.text(
-                                        "Share a list from the Lists page to create your first sync group",
-                                        size="2",
-                                        color_scheme="gray",
-                                        text_align="center",
-                                    ),
-                                    rx.link(
-                                        rx.button("Go to Lists", size="3"),
-                                        href="/lists",
+                                rx.foreach(
+                                    SyncState.sync_groups,
+                                    lambda group: sync_group_card(
+                                        group_id=group["id"],
+                                        group_name=group["group_name"],
+                                        sync_code=group["sync_code"],
+                                        member_count=group["member_count"],
+                                        sync_mode=group["sync_mode"],
+                                        last_sync=group["last_sync"],
+                                        key=group["id"],
                                     ),
-                                    spacing="3",
                                 ),
-                                min_height="40vh",
+                                columns=_GRID_COLUMNS,
+                                gap="1.5rem",
                                 width="100%",
                             ),
+                            _EMPTY_STATE,
                         ),
 
                         # Feedback
@@ -176,19 +214,11 @@ def sync_page() -> rx.Component:
                     width="100%",
                     max_width="1400px",
                     mx="auto",
-                    padding_x=["1rem", "2rem", "3rem"],
+                    padding_x=_GRID_PADDING_X,
                 ),
                 width="100%",
             ),
-            on_mount=[SyncState.load_sync_groups]
         ),
         # Fallback
-        rx.center(
-            rx.vstack(
-                rx.spinner(size="3"),
-                rx.text("Checking authentication...", size="3"),
-                spacing="3",
-            ),
-            min_height="85vh",
-        ),
+        CHECKING_AUTH_FALLBACK,
     )
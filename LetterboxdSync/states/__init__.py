@@ -1,9 +1,22 @@
 """States module."""
-from .base_state import BaseState
-from .auth_state import AuthState
-from .lists_state import ListsState
-from .list_detail_state import ListDetailState
-from .sync_state import SyncState
-from .manage_sync_state import ManageSyncState
+from importlib import import_module
+
+# State name -> submodule; loaded on first access so importing one state
+# (e.g. states.auth_state) doesn't build every other state's services
+_STATE_MODULES = {
+    "BaseState": "base_state",
+    "AuthState": "auth_state",
+    "ListsState": "lists_state",
+    "ListDetailState": "list_detail_state",
+    "SyncState": "sync_state",
+    "ManageSyncState": "manage_sync_state",
+}
 
 __all__ = ["BaseState", "AuthState", "ListsState", "ListDetailState", "SyncState", "ManageSyncState"]
+
+
+def __getattr__(name):
+    module = _STATE_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f".{module}", __name__), name)
@@ -1,4 +1,8 @@
 """Authentication state management."""
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 import reflex as rx
 from .base_state import BaseState
 from services.auth_service import AuthService
@@ -9,11 +13,59 @@ _auth_service = AuthService()
 COOKIE_NAME = "session_token"
 COOKIE_MAX_AGE = 3600 * 24 * 7  # 7 days persistence
 
+# How long a verified session is trusted before check_auth asks AuthService again
+VERIFY_TTL_SECONDS = 60
+
+# How long a logged-in Letterboxd session is reused before logging in again
+SCRAPER_TTL_SECONDS = 15 * 60
+
+# username -> (logged-in scraper, login time)
+_scraper_pool = {}
+_scraper_pool_lock = threading.Lock()
+
+# Scraper calls block, so handlers run them here to keep the event loop free;
+# the semaphore caps how many Letterboxd requests the app has in flight
+_letterboxd_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="letterboxd")
+_letterboxd_slots = asyncio.BoundedSemaphore(8)
+
+
+async def _run_letterboxd(fn, *args):
+    """Run a blocking Letterboxd call on the scraper pool."""
+    async with _letterboxd_slots:
+        return await asyncio.get_running_loop().run_in_executor(_letterboxd_executor, fn, *args)
+
+
+def _get_scraper(user_data: dict, list_url: str = "https://letterboxd.com"):
+    """Return a logged-in scraper for list_url, or None if login fails.
+
+    Scrapers share the user's pooled session, so repeat actions skip both the
+    Letterboxd login and the TLS handshake.
+    """
+    from LetterboxdScraper import LetterboxdScraper
+
+    username = user_data['username']
+    with _scraper_pool_lock:
+        pooled = _scraper_pool.get(username)
+    if pooled and time.monotonic() - pooled[1] < SCRAPER_TTL_SECONDS:
+        return pooled[0].for_list(list_url)
+
+    scraper = LetterboxdScraper(username, _auth_service.get_password(user_data['id']), list_url)
+    if not scraper.login():
+        return None
+
+    with _scraper_pool_lock:
+        _scraper_pool[username] = (scraper, time.monotonic())
+    return scraper
+
+
+def _drop_scraper(username: str):
+    """Forget a user's pooled Letterboxd session."""
+    with _scraper_pool_lock:
+        _scraper_pool.pop(username, None)
+
 class AuthState(BaseState):
     """State for authentication."""
 
-    username: str = ""
-    password: str = ""
     is_authenticated: bool = False
     current_user: str = ""
 
@@ -30,17 +82,15 @@ class AuthState(BaseState):
     redirect_to: str = ""
     auth_loading: bool = False
 
+    # When (and for which token) the session was last verified
+    _last_verified_at: float = 0.0
+    _verified_token: str = ""
+
     def set_loading(self, loading: bool):
         """Set loading state."""
         self.auth_loading = loading
         return
 
-    def set_username(self, value: str):
-        self.username = value
-
-    def set_password(self, value: str):
-        self.password = value
-
     @rx.event
     def on_load(self):
         """Check authentication on page load."""
@@ -54,12 +104,22 @@ class AuthState(BaseState):
 
     def check_auth(self) -> bool:
         """Check if user is authenticated."""
+        if (
+            self.is_authenticated
+            and self.session_token
+            and self.session_token == self._verified_token
+            and time.time() - self._last_verified_at < VERIFY_TTL_SECONDS
+        ):
+            return True
+
         if self.session_token:
             valid, user_data = _auth_service.verify_session(self.session_token)
 
             if valid:
                 self.is_authenticated = True
                 self.current_user = user_data['username']
+                self._verified_token = self.session_token
+                self._last_verified_at = time.time()
                 return True
 
         self.is_authenticated = False
@@ -71,12 +131,15 @@ class AuthState(BaseState):
         self.current_user = ""
         # Setting this to "" automatically clears the cookie on the client.
         self.session_token = ""
-        self.username = ""
-        self.password = ""
-
-    def login(self):
-        """Login or register user."""
-        if not self.username or not self.password:
+        self._verified_token = ""
+        self._last_verified_at = 0.0
+
+    async def login(self, form_data: dict):
+        """Login or register user from the submitted login form."""
+        # Kept local: state vars are sent to the client, the password must not be
+        username = form_data.get("username", "")
+        password = form_data.get("password", "")
+        if not username or not password:
             self.set_error("Please fill in all fields")
             return
 
@@ -85,18 +148,17 @@ class AuthState(BaseState):
         yield
 
         try:
-            success, session_token, message = _auth_service.register_or_login(
-                self.username,
-                self.password
+            success, session_token, message = await _auth_service.register_or_login_async(
+                username,
+                password
             )
 
             if success:
                 self.is_authenticated = True
-                self.current_user = self.username
+                self.current_user = username
                 # Setting the rx.Cookie var automatically saves it on the client
                 self.session_token = session_token
 
-                self.password = ""
                 self.set_success(message)
                 self.auth_loading = False
                 yield rx.redirect("/dashboard")
@@ -114,6 +176,7 @@ class AuthState(BaseState):
         """Logout user."""
         if self.session_token:
             _auth_service.logout(self.session_token)
+        _drop_scraper(self.current_user)
 
         # Clears user data and sets self.session_token = "" to clear the cookie.
         self._clear_user_data()
@@ -1,8 +1,136 @@
 """List detail state management."""
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 import reflex as rx
-from LetterboxdScraper import LetterboxdScraper
-from .auth_state import AuthState
-import math
+from .auth_state import AuthState, _get_scraper, _run_letterboxd
+
+# Converted Letterboxd pages keyed by (username, list_url, page): one LRU per
+# user, so a user's tabs share pages without evicting other users' prefetches
+_PAGE_CACHE_SIZE = 5
+_PAGE_CACHE_TTL_SECONDS = 300
+_page_cache = {}
+# Prefetches still running, so a click landing mid-prefetch waits on it
+_page_futures = {}
+# Bumped per user on invalidation so a prefetch started before it isn't cached
+_page_generations = {}
+_page_cache_lock = threading.Lock()
+_prefetch_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="list-prefetch")
+
+# Pulls a scraped movie's fields in one call; the scraper always sets these
+# keys, to a string or None for a missing attribute
+_movie_fields = itemgetter("name", "slug", "film_id", "link", "poster_url", "object_id", "rating")
+
+
+def _fetch_movies(user_data: dict, list_url: str, letterboxd_page: int):
+    """Scrape one Letterboxd page of a list; None if login fails."""
+    scraper = _get_scraper(user_data, list_url)
+
+    if scraper is None:
+        return None
+
+    # Get movies from specific page (server-side pagination)
+    movies_on_page = scraper.get_movies_by_page(letterboxd_page)
+
+    # Convert movies to the format expected by the frontend
+    converted_movies = []
+    for movie in movies_on_page or []:
+        name, slug, film_id, link, poster_url, object_id, rating = _movie_fields(movie)
+        rating = rating or ""
+        converted_movie = {
+            "name": name or "",
+            "slug": slug or "",
+            "film_id": film_id or "",
+            "link": link or "",
+            "rating": rating,
+            # Resolved here so each card renders off a single flag
+            "has_rating": rating != "",
+            "rating_label": f"⭐ {rating}/10",
+            "poster_url": poster_url or "",
+            "object_id": object_id or ""
+        }
+        converted_movies.append(converted_movie)
+    return converted_movies
+
+
+def _cached_page(key: tuple):
+    """Return (movies, in-flight future) for a page; either may be None."""
+    with _page_cache_lock:
+        movies = None
+        user_pages = _page_cache.get(key[0])
+        cached = user_pages.get(key) if user_pages else None
+        if cached is not None:
+            fetched_at, movies = cached
+            if time.monotonic() - fetched_at < _PAGE_CACHE_TTL_SECONDS:
+                user_pages.move_to_end(key)
+            else:
+                del user_pages[key]
+                movies = None
+        return movies, _page_futures.get(key)
+
+
+def _store_page(key: tuple, movies: list, generation: int = None):
+    """Cache a fetched page, evicting the user's least recently used.
+
+    A page fetched under an older generation than the user's current one
+    predates an invalidation and is dropped.
+    """
+    with _page_cache_lock:
+        if generation is not None and generation != _page_generations.get(key[0], 0):
+            return
+        user_pages = _page_cache.setdefault(key[0], OrderedDict())
+        user_pages[key] = (time.monotonic(), movies)
+        user_pages.move_to_end(key)
+        while len(user_pages) > _PAGE_CACHE_SIZE:
+            user_pages.popitem(last=False)
+
+
+def _drop_cached_pages(username: str, list_url: str = None):
+    """Forget a user's cached pages, of one list or all of them."""
+    with _page_cache_lock:
+        _page_generations[username] = _page_generations.get(username, 0) + 1
+        user_pages = _page_cache.get(username)
+        if not user_pages:
+            return
+        if list_url is None:
+            del _page_cache[username]
+            return
+        for key in [key for key in user_pages if key[1] == list_url]:
+            del user_pages[key]
+
+
+def _drop_group_pages(db, group_id: int):
+    """Forget the cached pages of every list in a sync group."""
+    for member in db.get_group_members(group_id):
+        _drop_cached_pages(member.username, member.list_url)
+
+
+def _prefetch_worker(key: tuple, user_data: dict, generation: int):
+    """Fetch a page in the background and cache it."""
+    movies = None
+    try:
+        movies = _fetch_movies(user_data, key[1], key[2])
+        if movies:
+            _store_page(key, movies, generation)
+    except Exception as e:
+        print(f"Error prefetching page {key[2]} of {key[1]}: {e}")
+    finally:
+        with _page_cache_lock:
+            _page_futures.pop(key, None)
+    return movies
+
+
+def _prefetch_page(key: tuple, user_data: dict):
+    """Start fetching a page unless it is cached or already on its way."""
+    with _page_cache_lock:
+        if key in _page_cache.get(key[0], ()) or key in _page_futures:
+            return
+        generation = _page_generations.get(key[0], 0)
+        _page_futures[key] = _prefetch_executor.submit(_prefetch_worker, key, user_data, generation)
+
 
 class ListDetailState(AuthState):
     """State for list detail page."""
@@ -10,7 +138,11 @@ class ListDetailState(AuthState):
     current_list_id: str = ""
     list_name: str = ""
     list_url: str = ""
-    movies: list[dict[str, str]] = []  # Added proper typing
+    # Full Letterboxd page of movies; only the visible window is sent to the client
+    _movies: list[dict[str, str | bool]] = []
+    _loaded_page: int = 0
+    visible_start: int = 0
+    page_size: int = 25
     current_page: int = 1
     total_count: int = 0
     total_pages: int = 0
@@ -18,6 +150,50 @@ class ListDetailState(AuthState):
     movies_per_letterboxd_page: int = 100
     list_detail_loading: bool = False
 
+    @rx.var
+    def visible_movies(self) -> list[dict[str, str | bool]]:
+        """Movies shown on the current page."""
+        return self._movies[self.visible_start:self.visible_start + self.page_size]
+
+    @rx.var
+    def prev_disabled(self) -> bool:
+        """Whether the previous-page button is disabled."""
+        return self.current_page == 1 or self.list_detail_loading
+
+    @rx.var
+    def next_disabled(self) -> bool:
+        """Whether the next-page button is disabled."""
+        return not self.has_more or self.list_detail_loading
+
+    @rx.var
+    def view_state(self) -> str:
+        """Which body the page shows: "ready", "loading", "error" or "empty"."""
+        if self.visible_movies:
+            return "ready"
+        if self.list_detail_loading:
+            return "loading"
+        if self.error_message:
+            return "error"
+        return "empty"
+
+    def _page_text(self, page: int) -> str:
+        """"Page 2 of 5", or just "Page 2" when the film count is unknown."""
+        if self.total_pages:
+            return f"Page {page} of {self.total_pages}"
+        return f"Page {page}"
+
+    @rx.var
+    def page_label(self) -> str:
+        """Pagination label, e.g. "Page 2 of 5"."""
+        return self._page_text(self.current_page)
+
+    @rx.var
+    def results_summary(self) -> str:
+        """Result count line shown under the movies grid."""
+        if self.total_count:
+            return f"Showing {len(self.visible_movies)} of {self.total_count} movies"
+        return f"Showing {len(self.visible_movies)} movies"
+
     def set_loading(self, loading: bool):
         """Set loading state."""
         self.list_detail_loading = loading
@@ -29,19 +205,28 @@ class ListDetailState(AuthState):
         self.list_name = list_name
         self.list_url = list_url
         self.current_page = 1
-        self.movies = []
+        self.visible_start = 0
+        self._movies = []
+        self._loaded_page = 0
 
-        # Use the film count from the lists API
+        # Use the film count from the lists API; Letterboxd groups thousands ("1,234")
         try:
-            self.total_count = int(film_count)
-            self.total_pages = math.ceil(self.total_count / self.movies_per_letterboxd_page)
+            self.total_count = int(str(film_count).replace(",", ""))
+            # Integer ceiling division; no float round-trip
+            self.total_pages = -(-self.total_count // self.page_size)
             self.has_more = self.total_pages > 1
         except (ValueError, TypeError):
+            # Unknown count; _show_page works out has_more from the loaded movies
             self.total_count = 0
             self.total_pages = 0
             self.has_more = False
 
-    def on_load(self):
+    def open_list(self, list_id: str, list_name: str, list_url: str, film_count: str = "0"):
+        """Set the current list and navigate to its page in one event."""
+        self.set_list_info(list_id, list_name, list_url, film_count)
+        return rx.redirect(f"/list/{list_id}")
+
+    async def on_load(self):
         """Load list details when page loads."""
         # First check authentication like other pages
         self.clear_messages()
@@ -52,7 +237,8 @@ class ListDetailState(AuthState):
 
         if not self.check_auth():
             self._clear_user_data()
-            return rx.redirect("/login")
+            yield rx.redirect("/login")
+            return
 
         # Get the list_id from the route parameter
         # In Reflex, dynamic route parameters are automatically available
@@ -61,14 +247,30 @@ class ListDetailState(AuthState):
         if route_list_id and not self.list_url:
             # We need to get list info from somewhere - maybe from ListsState
             # For now, let's trigger an error to load from lists page
-            return rx.redirect("/lists")
+            yield rx.redirect("/lists")
+            return
 
         # If we have list info, load the movies
         if self.list_url:
-            self.load_movies_page()
+            async for _ in self.load_movies_page():
+                yield
+
+    def _show_page(self, page: int, start: int):
+        """Point the visible window at a page of the cached movies."""
+        self.current_page = page
+        self.visible_start = start
+        if self.total_pages:
+            self.has_more = page < self.total_pages
+        else:
+            # More follows if this Letterboxd page continues past the window,
+            # or was full and so may have a successor
+            self.has_more = (
+                start + self.page_size < len(self._movies)
+                or len(self._movies) == self.movies_per_letterboxd_page
+            )
 
-    def load_movies_page(self, page: int = 1):
-        """Load movies for a specific Letterboxd page (server-side pagination)."""
+    async def load_movies_page(self, page: int = 1):
+        """Show a page of movies, fetching its Letterboxd page if not cached."""
         if not self.is_authenticated:
             self.set_error("Please login first")
             return
@@ -77,14 +279,27 @@ class ListDetailState(AuthState):
             self.set_error("No list selected")
             return
 
+        offset = (page - 1) * self.page_size
+        letterboxd_page = offset // self.movies_per_letterboxd_page + 1
+        start = offset % self.movies_per_letterboxd_page
+
+        # Pages inside the cached Letterboxd page need no round-trip
+        if letterboxd_page == self._loaded_page:
+            self.clear_messages()
+            self._show_page(page, start)
+            return
+
         self.set_loading(True)
         self.clear_messages()
 
+        # Send the loading flag so the grid dims while the page is fetched
+        yield
+
         try:
             # Use _auth_service (imported from auth_state) - same pattern as ListsState
             from .auth_state import _auth_service
 
-            valid, user_data = _auth_service.verify_session(self.session_token)
+            valid, user_data = await asyncio.to_thread(_auth_service.verify_session, self.session_token)
 
             if not valid:
                 self.set_error("Session expired. Please login again.")
@@ -92,46 +307,46 @@ class ListDetailState(AuthState):
                 self.set_loading(False)
                 return
 
-            scraper = LetterboxdScraper(
-                user_data['username'],
-                user_data['password'],
-                self.list_url
-            )
+            username = user_data['username']
+            key = (username, self.list_url, letterboxd_page)
+            generation = _page_generations.get(username, 0)
 
-            if not scraper.login():
-                self.set_error("Failed to connect to Letterboxd")
-                self.set_loading(False)
-                return
+            converted_movies, pending = _cached_page(key)
+            if converted_movies is None and pending is not None:
+                converted_movies = await asyncio.wrap_future(pending)
+            if converted_movies is None:
+                converted_movies = await _run_letterboxd(_fetch_movies, user_data, self.list_url, letterboxd_page)
+                if converted_movies is None:
+                    self.set_error("Failed to connect to Letterboxd")
+                    self.set_loading(False)
+                    return
+                if converted_movies:
+                    _store_page(key, converted_movies, generation)
+
+            if converted_movies:
+                self._movies = converted_movies
+                self._loaded_page = letterboxd_page
+                self._show_page(page, start)
+
+                # Fetch the following Letterboxd page while this one is read
+                if self.total_count:
+                    has_next_page = letterboxd_page * self.movies_per_letterboxd_page < self.total_count
+                else:
+                    has_next_page = len(converted_movies) == self.movies_per_letterboxd_page
+                if has_next_page:
+                    _prefetch_page((username, self.list_url, letterboxd_page + 1), user_data)
 
-            # Get movies from specific page (server-side pagination)
-            movies_on_page = scraper.get_movies_by_page(page)
-
-            if movies_on_page:
-                # Convert movies to the format expected by the frontend
-                converted_movies = []
-                for movie in movies_on_page:
-                    converted_movie = {
-                        "name": str(movie.get("name", "")),
-                        "slug": str(movie.get("slug", "")),
-                        "film_id": str(movie.get("film_id", "")),
-                        "link": str(movie.get("link", "")),
-                        "rating": str(movie.get("rating", "") if movie.get("rating") else ""),
-                        "poster_url": str(movie.get("poster_url", "")),
-                        "object_id": str(movie.get("object_id", ""))
-                    }
-                    converted_movies.append(converted_movie)
-
-                self.movies = converted_movies
-                self.current_page = page
-                self.has_more = page < self.total_pages
-
-                self.set_success(f"Loaded {len(self.movies)} movies (Page {page} of {self.total_pages})")
+                shown = len(converted_movies[start:start + self.page_size])
+                self.set_success(f"Loaded {shown} movies ({self._page_text(page)})")
             else:
                 # If no movies on this page, we might be at the end
                 if page == 1:
-                    self.movies = []
+                    self._movies = []
+                    self._loaded_page = 0
                     self.set_error("No movies found in this list")
                 else:
+                    # Reached past the end of a list whose count was unknown
+                    self.has_more = False
                     self.set_error(f"No movies found on page {page}")
 
         except Exception as e:
@@ -139,17 +354,20 @@ class ListDetailState(AuthState):
         finally:
             self.set_loading(False)
 
-    def next_page(self):
+    async def next_page(self):
         """Load next page of movies."""
         if self.has_more and not self.list_detail_loading:
-            self.load_movies_page(self.current_page + 1)
+            async for _ in self.load_movies_page(self.current_page + 1):
+                yield
 
-    def prev_page(self):
+    async def prev_page(self):
         """Load previous page of movies."""
         if self.current_page > 1 and not self.list_detail_loading:
-            self.load_movies_page(self.current_page - 1)
+            async for _ in self.load_movies_page(self.current_page - 1):
+                yield
 
-    def go_to_page(self, page: int):
+    async def go_to_page(self, page: int):
         """Go to specific page."""
-        if 1 <= page <= self.total_pages and not self.list_detail_loading:
-            self.load_movies_page(page)
\ No newline at end of file
+        if 1 <= page and (not self.total_pages or page <= self.total_pages) and not self.list_detail_loading:
+            async for _ in self.load_movies_page(page):
+                yield
\ No newline at end of file
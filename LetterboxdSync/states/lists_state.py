@@ -1,18 +1,27 @@
 """Lists state management."""
+import asyncio
+from operator import itemgetter
 import reflex as rx
 from .auth_state import AuthState
-from LetterboxdScraper import LetterboxdScraper
-from ..states.sync_state import SyncState
+
+# Pulls a scraped list's fields in one call; the scraper always sets these
+# keys, to a string or None for a missing attribute
+_list_fields = itemgetter("id", "name", "slug", "url", "film_count", "description", "owner")
 
 
 class ListsState(AuthState):
     """State for managing user lists."""
 
-    user_lists: list[dict[str, str]] = []
+    user_lists: list[dict[str, str | bool]] = []
     selected_list: dict[str, str] = {}
     sharing_status_loading: bool = False
     lists_loading: bool = False
 
+    @rx.var
+    def has_lists(self) -> bool:
+        """Whether any lists are loaded."""
+        return len(self.user_lists) > 0
+
     def set_loading(self, loading: bool):
         """Set loading state."""
         self.lists_loading = loading
@@ -24,10 +33,29 @@ class ListsState(AuthState):
             # Return the event instead of calling it directly
             return ListsState.fetch_user_lists
 
-        # Return an event to trigger a reactive SyncState call
-        return SyncState.refresh_shared_status_for_lists(self.user_lists)
+        return ListsState.refresh_shared_status
+
+    def _mark_shared(self, user_lists: list[dict]) -> list[dict]:
+        """Store an is_shared flag on each list so cards get a plain boolean prop."""
+        try:
+            from sync_manager import SyncManager
+            db = SyncManager().db
+            urls = [list_item["url"] for list_item in user_lists if list_item.get("url")]
+            shared = db.get_shared_list_urls(urls)
+            for list_item in user_lists:
+                list_item["is_shared"] = list_item.get("url", "") in shared
+        except Exception as e:
+            print(f"Error refreshing shared list status: {e}")
+            for list_item in user_lists:
+                list_item.setdefault("is_shared", False)
+        return user_lists
+
+    async def refresh_shared_status(self):
+        """Re-read the shared flag of every loaded list."""
+        user_lists = [dict(list_item) for list_item in self.user_lists]
+        self.user_lists = await asyncio.to_thread(self._mark_shared, user_lists)
 
-    def fetch_user_lists(self):
+    async def fetch_user_lists(self):
         """Fetch all lists for the current user."""
         if not self.is_authenticated:
             self.set_error("Please login first")
@@ -42,64 +70,54 @@ class ListsState(AuthState):
 
         try:
             # Use _auth_service (imported from auth_state)
-            from .auth_state import _auth_service
+            from .auth_state import _auth_service, _get_scraper, _run_letterboxd
 
-            valid, user_data = _auth_service.verify_session(self.session_token)
+            valid, user_data = await asyncio.to_thread(_auth_service.verify_session, self.session_token)
 
             if not valid:
                 self.set_error("Session expired. Please login again.")
                 self.is_authenticated = False
                 self.set_loading(False)
-                yield
                 return
 
-            scraper = LetterboxdScraper(
-                user_data['username'],
-                user_data['password'],
-                "https://letterboxd.com"
-            )
+            scraper = await _run_letterboxd(_get_scraper, user_data)
 
-            if not scraper.login():
+            if scraper is None:
                 self.set_error("Failed to connect to Letterboxd")
                 self.set_loading(False)
-                yield
                 return
 
-            lists = scraper.get_all_lists(user_data['username'])
+            lists = await _run_letterboxd(scraper.get_all_lists, user_data['username'])
 
             if lists:
                 converted_lists = []
                 for list_item in lists:
+                    list_id, name, slug, url, film_count, description, owner = _list_fields(list_item)
                     converted_list = {
-                        "id": str(list_item.get("id", "")),
-                        "name": str(list_item.get("name", "")),
-                        "slug": str(list_item.get("slug", "")),
-                        "url": str(list_item.get("url", "")),
-                        "film_count": str(list_item.get("film_count", "0")),
-                        "description": str(list_item.get("description", "")),
-                        "owner": str(list_item.get("owner", ""))
+                        "id": list_id or "",
+                        "name": name or "",
+                        "slug": slug or "",
+                        "url": url or "",
+                        "film_count": film_count,
+                        "film_count_label": f"🎬 {film_count}",
+                        "description": description,
+                        "has_description": bool(description),
+                        "owner": owner or ""
                     }
                     converted_lists.append(converted_list)
 
-                self.user_lists = converted_lists
-                yield
-
+                # Shared flags are merged in first so the lists go out in one
+                # update; the handler's exit sends it
+                self.user_lists = await asyncio.to_thread(self._mark_shared, converted_lists)
                 self.set_success(f"Found {len(lists)} lists!")
             else:
                 self.set_error("No lists found")
 
             self.set_loading(False)
-            return SyncState.refresh_shared_status_for_lists(self.user_lists)
 
         except Exception as e:
             self.set_error(f"Error: {str(e)}")
             self.set_loading(False)
-            yield
-
-    def check_shared_status_for_lists(self):
-        """Delegate to SyncState to refresh shared statuses."""
-        from ..states.sync_state import SyncState
-        yield from SyncState.refresh_shared_status_for_lists(self.user_lists)
 
     def select_list(self, list_id: str, list_name: str, list_url: str, film_count: str = "0"):
         """Select a list."""
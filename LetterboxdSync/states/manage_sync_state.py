@@ -1,16 +1,53 @@
 """Manage sync group state."""
+import asyncio
 import reflex as rx
 from .auth_state import AuthState
+from .list_detail_state import _drop_group_pages
 
 class ManageSyncState(AuthState):
     """State for managing individual sync groups."""
 
     current_group_id: str = ""
-    group_info: dict[str, str] = {}
+    _group_info: dict[str, str] = {}
     group_members: list[dict[str, str]] = []
     show_unshare_dialog: bool = False
 
-    def on_load(self):
+    @rx.var
+    def has_members(self) -> bool:
+        """Whether the group has any members."""
+        return len(self.group_members) > 0
+
+    @rx.var
+    def group_name(self) -> str:
+        """Name of the loaded group."""
+        return self._group_info.get("group_name", "Loading...")
+
+    @rx.var
+    def group_sync_code(self) -> str:
+        """Sync code of the loaded group."""
+        return self._group_info.get("sync_code", "")
+
+    @rx.var
+    def group_sync_mode(self) -> str:
+        """Sync mode of the loaded group."""
+        return self._group_info.get("sync_mode", "")
+
+    @rx.var
+    def group_created_at(self) -> str:
+        """Creation date of the loaded group."""
+        return self._group_info.get("created_at", "")
+
+    @rx.var
+    def group_last_sync(self) -> str:
+        """Last sync date of the loaded group."""
+        return self._group_info.get("last_sync", "Never")
+
+    @rx.var
+    def group_id(self) -> str:
+        """Id of the loaded group."""
+        return self._group_info.get("id", "")
+
+    async def on_load(self):
         """Load when page loads - get sync_code from route parameter."""
         # First do auth check
         self.clear_messages()
@@ -22,16 +59,16 @@ class ManageSyncState(AuthState):
 
         # The sync_code comes from the route parameter [sync_code]
         if hasattr(self, 'sync_code') and self.sync_code:
-            self.load_group_by_sync_code(self.sync_code)
+            await self.load_group_by_sync_code(self.sync_code)
 
-    def load_group_by_sync_code(self, sync_code: str):
+    async def load_group_by_sync_code(self, sync_code: str):
         """Load sync group information by sync code."""
         try:
             from sync_manager import SyncManager
             sync_manager = SyncManager()
             db = sync_manager.db
 
-            group = db.get_sync_group(sync_code)
+            group = await asyncio.to_thread(db.get_sync_group, sync_code)
             if not group:
                 self.set_error("Sync group not found")
                 return
@@ -45,7 +82,7 @@ class ManageSyncState(AuthState):
             if last_sync != "Never" and len(last_sync) > 10:
                 last_sync = last_sync[:10]
 
-            self.group_info = {
+            self._group_info = {
                 "id": str(group.id),
                 "sync_code": group.sync_code,
                 "group_name": group.group_name,
@@ -57,7 +94,7 @@ class ManageSyncState(AuthState):
             self.current_group_id = str(group.id)
 
             # Get group members
-            members = db.get_group_members(group.id)
+            members = await asyncio.to_thread(db.get_group_members, group.id)
             converted_members = []
 
             for member in members:
@@ -131,6 +168,8 @@ class ManageSyncState(AuthState):
             sync_manager = SyncManager()
 
             result = await sync_manager.sync_group_now(int(self.current_group_id))
+            # Members' lists may have changed even if the sync partly failed
+            await asyncio.to_thread(_drop_group_pages, sync_manager.db, int(self.current_group_id))
 
             if result['success']:
                 self.set_success(f"Sync completed! {result['operations_count']} operations performed.")
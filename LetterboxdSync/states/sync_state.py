@@ -1,76 +1,45 @@
 """Sync state management."""
+import asyncio
 import reflex as rx
+from datetime import datetime, timezone
 from .auth_state import AuthState
+from .list_detail_state import _drop_cached_pages, _drop_group_pages
 
 class SyncState(AuthState):
     """State for sync operations."""
 
     shared_lists: list[dict[str, str]] = []
     sync_groups: list[dict[str, str]] = []
-    shared_list_status: dict[str, bool] = {}
     sync_loading: bool = False
 
+    @rx.var
+    def has_sync_groups(self) -> bool:
+        """Whether the user belongs to any sync groups."""
+        return len(self.sync_groups) > 0
+
     def _get_sync_manager(self):
         """Get a sync manager instance."""
         from sync_manager import SyncManager
         return SyncManager()
 
-    def refresh_shared_status(self):
-        """Refresh the shared status - simplified version"""
-        # Don't try to access other states, just prepare empty dict
-        # The status will be checked when share/unshare is clicked
-        if not hasattr(self, 'shared_list_status') or not self.shared_list_status:
-            self.shared_list_status = {}
-
-    def refresh_shared_status_for_lists(self, user_lists: list[dict[str, str]]):
-        """Refresh shared status for a batch of lists."""
-        self.sync_loading = True
-        yield  # allows the spinner to show
-
-        try:
-            sync_manager = self._get_sync_manager()
-            db = sync_manager.db
-
-            new_status = {}
-            for list_item in user_lists:
-                list_url = list_item.get("url", "")
-                if list_url:
-                    new_status[list_url] = db.is_list_already_shared(list_url)
-
-            self.shared_list_status = new_status
-
-        except Exception as e:
-            print(f"Error refreshing shared list status: {e}")
-
-        finally:
-            self.sync_loading = False
-            yield  # triggers a frontend re-render with new button states
-
     def check_if_list_shared(self, list_url: str) -> bool:
         """Check if a specific list is shared - called on demand"""
         try:
             sync_manager = self._get_sync_manager()
             db = sync_manager.db
-            is_shared = db.is_list_already_shared(list_url)
-
-            # Update the cache
-            new_status = dict(self.shared_list_status)
-            new_status[list_url] = is_shared
-            self.shared_list_status = new_status
-
-            return is_shared
+            return db.is_list_already_shared(list_url)
         except Exception as e:
             print(f"Error checking if list is shared: {e}")
             return False
 
-    def share_list(self, list_id: str, list_name: str, list_url: str):
+    async def share_list(self, list_id: str, list_name: str, list_url: str):
         """Share a list by creating a sync group."""
         if not self.is_authenticated:
             self.set_error("Please login first")
             return
 
         # Check if already shared first
-        if self.check_if_list_shared(list_url):
+        if await asyncio.to_thread(self.check_if_list_shared, list_url):
             self.set_error("This list is already shared!")
             return
 
@@ -81,30 +50,28 @@ class SyncState(AuthState):
         try:
             # Use _auth_service to get credentials
             from .auth_state import _auth_service
-            valid, user_data = _auth_service.verify_session(self.session_token)
+            valid, user_data = await asyncio.to_thread(_auth_service.verify_session, self.session_token)
 
             if not valid:
                 self.set_error("Session expired. Please login again.")
                 self.is_authenticated = False
                 self.sync_loading = False
-                return None
+                return
 
             sync_manager = self._get_sync_manager()
+            password = await asyncio.to_thread(_auth_service.get_password, user_data['id'])
 
             # Create sync group with the user's list as master
-            group_id, sync_code = sync_manager.create_sync_group(
+            group_id, sync_code = await asyncio.to_thread(
+                sync_manager.create_sync_group,
                 group_name=f"{list_name} - Shared",
                 sync_mode="master_slave",
                 master_username=user_data['username'],
-                master_password=user_data['password'],
+                master_password=password,
                 master_list_url=list_url,
                 master_display_name=user_data['username']
             )
-
-            # Update the shared status
-            new_status = dict(self.shared_list_status)
-            new_status[list_url] = True
-            self.shared_list_status = new_status
+            _drop_cached_pages(user_data['username'], list_url)
 
             self.set_success(f"List shared! Sync code: {sync_code}")
 
@@ -112,7 +79,7 @@ class SyncState(AuthState):
             self.load_sync_groups()
 
             # Redirect to sync page
-            return rx.redirect("/sync")
+            yield rx.redirect("/sync")
 
         except Exception as e:
             self.set_error(f"Error sharing list: {str(e)}")
@@ -139,6 +106,15 @@ class SyncState(AuthState):
         except Exception as e:
             self.set_error(f"Error navigating to manage page: {str(e)}")
 
+    async def sync_action(self, list_id: str, list_name: str, list_url: str, is_shared: bool):
+        """Manage a shared list, or share it if it isn't shared yet."""
+        if is_shared:
+            yield self.navigate_to_manage(list_url)
+            return
+
+        async for update in self.share_list(list_id, list_name, list_url):
+            yield update
+
     def unshare_list(self, list_url: str):
         """Unshare a list by deactivating the sync group"""
         if not self.is_authenticated:
@@ -169,11 +145,6 @@ class SyncState(AuthState):
                                ''', (sync_group_info['id'],))
                 conn.commit()
 
-            # Update the shared status
-            new_status = dict(self.shared_list_status)
-            new_status[list_url] = False
-            self.shared_list_status = new_status
-
             self.set_success("List unshared successfully!")
 
             # Refresh sync groups
@@ -212,6 +183,15 @@ class SyncState(AuthState):
         except Exception as e:
             self.set_error(f"Error loading sync groups: {str(e)}")
 
+    def _mark_group_synced(self, group_id: str):
+        """Update last_sync on one group instead of reloading every group."""
+        # Same format as the CURRENT_TIMESTAMP the sync service stores
+        last_sync = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        for i, group in enumerate(self.sync_groups):
+            if group["id"] == group_id:
+                self.sync_groups[i] = {**group, "last_sync": last_sync}
+                break
+
     async def sync_group_now(self, group_id: str):
         """Trigger immediate sync of a specific group."""
         self.sync_loading = True
@@ -222,7 +202,11 @@ class SyncState(AuthState):
             sync_manager = self._get_sync_manager()
             result = await sync_manager.sync_group_now(int(group_id))
 
+            # Members' lists may have changed even if the sync partly failed
+            await asyncio.to_thread(_drop_group_pages, sync_manager.db, int(group_id))
+
             if result['success']:
+                self._mark_group_synced(group_id)
                 self.set_success(f"Sync completed! {result['operations_count']} operations performed.")
             else:
                 self.set_error(f"Sync failed: {', '.join(result.get('errors', []))}")
@@ -4,7 +4,7 @@ import secrets
 import string
 import threading
 import time
-from typing import List, Optional, Tuple
+from typing import List, Optional, Set, Tuple
 from cryptography.fernet import Fernet
 import os
 from contextlib import contextmanager
@@ -278,6 +278,23 @@ class DatabaseManager:
                            ''', (list_url,))
             return cursor.fetchone() is not None
 
+    def get_shared_list_urls(self, list_urls: List[str]) -> Set[str]:
+        """Return which of the given list URLs are shared in an active sync group"""
+        shared = set()
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            # Batches stay under SQLite's bound-variable limit
+            for i in range(0, len(list_urls), 500):
+                batch = list_urls[i:i + 500]
+                placeholders = ", ".join("?" * len(batch))
+                cursor.execute(f'''
+                               SELECT DISTINCT sgm.list_url FROM sync_group_members sgm
+                                             JOIN sync_groups sg ON sgm.sync_group_id = sg.id
+                               WHERE sgm.list_url IN ({placeholders}) AND sgm.is_active = 1 AND sg.is_active = 1
+                               ''', batch)
+                shared.update(row[0] for row in cursor.fetchall())
+        return shared
+
     def get_sync_group_by_list_url(self, list_url: str) -> Optional[dict]:
         """Get sync group information for a specific list URL"""
         with self.get_connection() as conn:
@@ -363,6 +380,20 @@ class DatabaseManager:
                 ''', (member_id, film_id, is_present))
                 conn.commit()
 
+    def update_user_movie_states(self, member_id: int, film_ids, is_present: bool = True):
+        """Update the state of many movies in a user's list in one transaction"""
+        rows = [(member_id, film_id, is_present) for film_id in film_ids]
+        if not rows:
+            return
+        with self._lock:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.executemany('''
+                    INSERT OR REPLACE INTO user_movie_states (member_id, film_id, is_present, added_at)
+                    VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+                ''', rows)
+                conn.commit()
+
     def get_user_movie_states(self, member_id: int) -> List[str]:
         """Get all film IDs currently in a user's list"""
         with self.get_connection() as conn:
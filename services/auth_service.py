@@ -1,22 +1,71 @@
 """Authentication service with database operations."""
+import asyncio
+import atexit
+import base64
 import sqlite3
 import hashlib
+import hmac
+import queue
 import secrets
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
 from typing import Optional, Tuple
-from datetime import datetime, timedelta
+from datetime import datetime
 from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 import os
 import sys
 
 # Add parent directory to path to import LetterboxdScraper
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-from LetterboxdScraper import LetterboxdScraper
+_PARENT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+if _PARENT_DIR not in sys.path:
+    sys.path.insert(0, _PARENT_DIR)
 from db.db_config import db_config
 
 
+@lru_cache(maxsize=1)
+def _load_or_create_key(key_file: str) -> bytes:
+    """Read the key at key_file, creating it first if missing; cached per path."""
+    if os.path.exists(key_file):
+        with open(key_file, 'rb') as f:
+            return f.read()
+
+    # Ensure directory exists
+    key_dir = os.path.dirname(key_file)
+    if not os.path.isdir(key_dir):
+        os.makedirs(key_dir, exist_ok=True)
+    key = Fernet.generate_key()
+    with open(key_file, 'wb') as f:
+        f.write(key)
+    return key
+
+
 class AuthService:
     """Service for authentication and user management."""
 
+    # Max number of verified sessions kept in memory
+    SESSION_CACHE_SIZE = 1024
+
+    # How long a cached session is trusted before the row is read again. Other
+    # worker processes can't evict this cache on logout, so this bounds how
+    # long a revoked token keeps working there.
+    SESSION_CACHE_TTL_SECONDS = 60
+
+    # PBKDF2 runs inside OpenSSL, which picks SHA-NI code paths itself when
+    # the CPU has them; scrypt (n=2**14) measured slower on the same build.
+    PASSWORD_HASH_ALGORITHM = 'sha256'
+    PASSWORD_HASH_ITERATIONS = 100000
+
+    SESSION_LIFETIME_SECONDS = 7 * 24 * 60 * 60
+
+    # Marks credentials encrypted with AES-GCM; anything else is a Fernet token
+    _GCM_PREFIX = 'gcm:'
+
     def __init__(self, db_path: str = None):
         # Use centralized config if no specific path provided
         if db_path is None:
@@ -25,39 +74,102 @@ class AuthService:
         self.db_path = db_path
 
         # Ensure the directory exists
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        db_dir = os.path.dirname(self.db_path)
+        if not os.path.isdir(db_dir):
+            os.makedirs(db_dir, exist_ok=True)
 
         self.encryption_key = self._get_or_create_encryption_key()
         self.cipher = Fernet(self.encryption_key)
+        # AES-GCM key derived once from the stored key, separate from Fernet's halves
+        self._aesgcm = AESGCM(HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=None,
+            info=b'letterboxdsync-credentials-aesgcm',
+        ).derive(base64.urlsafe_b64decode(self.encryption_key)))
+
+        # session_token -> (cached-until epoch, user dict); skips SQLite on hits
+        self._session_cache = OrderedDict()
+        self._session_cache_lock = threading.Lock()
+
+        # One connection for the service's lifetime; SQLite's statement cache
+        # is per connection, so repeated queries skip re-parsing.
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA cache_size=-8000")
+        self._db_lock = threading.RLock()
+        atexit.register(self._conn.close)
+
         self._init_database()
 
+        # last_login / letterboxd_session aren't needed to issue a session, so
+        # a background writer batches them off the login path
+        self._login_updates = queue.Queue()
+        threading.Thread(target=self._login_update_writer, name="auth-login-writer", daemon=True).start()
+        atexit.register(self._flush_login_updates)
+
+    def _login_update_writer(self):
+        """Write queued login bookkeeping, batching whatever piles up."""
+        while True:
+            self._flush_login_updates(self._login_updates.get())
+
+    def _flush_login_updates(self, first: Optional[tuple] = None):
+        """Write queued login bookkeeping in one transaction."""
+        updates = [first] if first else []
+        while True:
+            try:
+                updates.append(self._login_updates.get_nowait())
+            except queue.Empty:
+                break
+        if not updates:
+            return
+
+        try:
+            with self._connection() as conn:
+                conn.executemany('''
+                                 UPDATE users
+                                 SET last_login = ?, letterboxd_session = ?
+                                 WHERE id = ?
+                                 ''', updates)
+                conn.commit()
+        except sqlite3.Error as e:
+            print(f"Error writing login updates: {e}")
+
+    @contextmanager
+    def _connection(self):
+        """Yield the shared connection, serialized across threads."""
+        with self._db_lock:
+            try:
+                yield self._conn
+            except Exception:
+                self._conn.rollback()
+                raise
+
     def _get_or_create_encryption_key(self) -> bytes:
         """Get or create encryption key for credentials."""
-        key_file = db_config.get_auth_key_path()
-
-        if os.path.exists(key_file):
-            with open(key_file, 'rb') as f:
-                return f.read()
-        else:
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(key_file), exist_ok=True)
-            key = Fernet.generate_key()
-            with open(key_file, 'wb') as f:
-                f.write(key)
-            return key
+        return _load_or_create_key(db_config.get_auth_key_path())
 
     def _encrypt_credential(self, credential: str) -> str:
         """Encrypt a credential string."""
-        return self.cipher.encrypt(credential.encode()).decode()
+        nonce = os.urandom(12)
+        ciphertext = self._aesgcm.encrypt(nonce, credential.encode(), None)
+        return self._GCM_PREFIX + base64.urlsafe_b64encode(nonce + ciphertext).decode()
 
     def _decrypt_credential(self, encrypted_credential: str) -> str:
         """Decrypt a credential string."""
+        if encrypted_credential.startswith(self._GCM_PREFIX):
+            data = base64.urlsafe_b64decode(encrypted_credential[len(self._GCM_PREFIX):])
+            return self._aesgcm.decrypt(data[:12], data[12:], None).decode()
+        # Rows written before the switch to AES-GCM
         return self.cipher.decrypt(encrypted_credential.encode()).decode()
 
     def _init_database(self):
         """Initialize database with users table."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.cursor()
+            # session_token's UNIQUE constraint creates the index verify_session and
+            # logout search; a separate (even partial) index goes unused by the planner
             cursor.execute('''
                            CREATE TABLE IF NOT EXISTS users (
                                                                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -67,7 +179,7 @@ class AuthService:
                                password_encrypted TEXT NOT NULL,
                                letterboxd_session TEXT,
                                session_token TEXT UNIQUE,
-                               session_expires TIMESTAMP,
+                               session_expires INTEGER,
                                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                                last_login TIMESTAMP
                                )
@@ -77,27 +189,45 @@ class AuthService:
     def _hash_password(self, password: str, salt: str) -> str:
         """Hash password with salt using PBKDF2."""
         return hashlib.pbkdf2_hmac(
-            'sha256',
+            self.PASSWORD_HASH_ALGORITHM,
             password.encode('utf-8'),
             salt.encode('utf-8'),
-            100000
+            self.PASSWORD_HASH_ITERATIONS
         ).hex()
 
     def _generate_salt(self) -> str:
         """Generate a random salt."""
         return secrets.token_hex(32)
 
+    def _cache_session(self, session_token: str, expires_at: float, user: dict):
+        """Remember a verified session for a short while, never past its expiry."""
+        cached_until = min(expires_at, time.time() + self.SESSION_CACHE_TTL_SECONDS)
+        with self._session_cache_lock:
+            self._session_cache[session_token] = (cached_until, user)
+            self._session_cache.move_to_end(session_token)
+            while len(self._session_cache) > self.SESSION_CACHE_SIZE:
+                self._session_cache.popitem(last=False)
+
+    def _evict_session(self, session_token: Optional[str]):
+        """Drop a session from the cache."""
+        if session_token:
+            with self._session_cache_lock:
+                self._session_cache.pop(session_token, None)
+
     def _generate_session_token(self) -> str:
         """Generate a session token."""
         return secrets.token_urlsafe(64)
 
     def verify_letterboxd_credentials(self, username: str, password: str) -> Tuple[bool, Optional[str]]:
         """Verify credentials with Letterboxd."""
+        # Imported here so loading the auth service doesn't pull in the scraper stack
+        from LetterboxdScraper import LetterboxdScraper
+
         try:
             scraper = LetterboxdScraper(username, password, "https://letterboxd.com")
 
             if scraper.login():
-                session_data = scraper.session.cookies.get_dict()
+                session_data = scraper.get_cookies()
                 return True, str(session_data)
             return False, None
         except Exception as e:
@@ -111,60 +241,93 @@ class AuthService:
         if not letterboxd_verified:
             return False, None, "Invalid Letterboxd credentials"
 
-        password_encrypted = self._encrypt_credential(password)
+        return self._issue_session(username, password, letterboxd_session)
+
+    def _issue_session(self, username: str, password: str, letterboxd_session: Optional[str]) -> Tuple[bool, Optional[str], str]:
+        """Log in or create a user whose Letterboxd credentials were verified.
 
-        with sqlite3.connect(self.db_path) as conn:
+        PBKDF2 takes ~100ms, so hashing and encryption happen outside the
+        connection lock, which is held only for the statements themselves.
+        """
+        with self._connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT id, password_hash, salt FROM users WHERE username = ?", (username,))
+            cursor.execute("SELECT id, password_hash, salt, session_token FROM users WHERE username = ?", (username,))
             result = cursor.fetchone()
 
-            if result:
-                user_id, stored_hash, salt = result
-                password_hash = self._hash_password(password, salt)
-
-                if password_hash == stored_hash:
-                    session_token = self._generate_session_token()
-                    session_expires = datetime.now() + timedelta(days=7)
-
-                    cursor.execute('''
-                                   UPDATE users
-                                   SET session_token = ?, session_expires = ?,
-                                       last_login = CURRENT_TIMESTAMP,
-                                       letterboxd_session = ?,
-                                       password_encrypted = ?
-                                   WHERE id = ?
-                                   ''', (session_token, session_expires, letterboxd_session, password_encrypted, user_id))
-                    conn.commit()
-
-                    return True, session_token, "Login successful"
-                else:
-                    return False, None, "Invalid credentials"
-            else:
-                salt = self._generate_salt()
-                password_hash = self._hash_password(password, salt)
-                session_token = self._generate_session_token()
-                session_expires = datetime.now() + timedelta(days=7)
-
-                cursor.execute('''
-                               INSERT INTO users
-                               (username, password_hash, salt, password_encrypted, session_token,
-                                session_expires, last_login, letterboxd_session)
-                               VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, ?)
-                               ''', (username, password_hash, salt, password_encrypted, session_token,
-                                     session_expires, letterboxd_session))
+        if result:
+            user_id, stored_hash, salt, old_session_token = result
+            password_hash = self._hash_password(password, salt)
+
+            if not hmac.compare_digest(password_hash, stored_hash):
+                return False, None, "Invalid credentials"
+
+            # The previous token is replaced below
+            self._evict_session(old_session_token)
+            session_token = self._generate_session_token()
+            session_expires = int(time.time()) + self.SESSION_LIFETIME_SECONDS
+
+            # The hash matched, so the stored encrypted password is already current
+            with self._connection() as conn:
+                conn.execute('''
+                             UPDATE users
+                             SET session_token = ?, session_expires = ?
+                             WHERE id = ?
+                             ''', (session_token, session_expires, user_id))
                 conn.commit()
 
-                return True, session_token, "Account created successfully"
+            # Same format as SQLite's CURRENT_TIMESTAMP
+            last_login = time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime())
+            self._login_updates.put((last_login, letterboxd_session, user_id))
+
+            return True, session_token, "Login successful"
+
+        salt = self._generate_salt()
+        password_hash = self._hash_password(password, salt)
+        password_encrypted = self._encrypt_credential(password)
+        session_token = self._generate_session_token()
+        session_expires = int(time.time()) + self.SESSION_LIFETIME_SECONDS
+
+        try:
+            with self._connection() as conn:
+                conn.execute('''
+                             INSERT INTO users
+                             (username, password_hash, salt, password_encrypted, session_token,
+                              session_expires, last_login, letterboxd_session)
+                             VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, ?)
+                             ''', (username, password_hash, salt, password_encrypted, session_token,
+                                   session_expires, letterboxd_session))
+                conn.commit()
+        except sqlite3.IntegrityError:
+            # A concurrent first login created the user while we were hashing
+            return self._issue_session(username, password, letterboxd_session)
+
+        return True, session_token, "Account created successfully"
+
+    async def register_or_login_async(self, username: str, password: str) -> Tuple[bool, Optional[str], str]:
+        """Register or login user from a worker thread.
+
+        The Letterboxd round trip and PBKDF2 hash both block, so running them
+        off the event loop keeps other events flowing during a login.
+        """
+        return await asyncio.to_thread(self.register_or_login, username, password)
 
     def verify_session(self, session_token: str) -> Tuple[bool, Optional[dict]]:
         """Verify session token."""
         if not session_token:
             return False, None
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._session_cache_lock:
+            cached = self._session_cache.get(session_token)
+        if cached:
+            cached_until, user = cached
+            if cached_until > time.time():
+                return True, dict(user)
+            self._evict_session(session_token)
+
+        with self._connection() as conn:
             cursor = conn.cursor()
             cursor.execute('''
-                           SELECT id, username, session_expires, letterboxd_session, password_encrypted
+                           SELECT id, username, session_expires, letterboxd_session
                            FROM users
                            WHERE session_token = ?
                            ''', (session_token,))
@@ -174,23 +337,44 @@ class AuthService:
             if not result:
                 return False, None
 
-            user_id, username, session_expires, letterboxd_session, password_encrypted = result
+            user_id, username, session_expires, letterboxd_session = result
 
-            if datetime.fromisoformat(session_expires) < datetime.now():
+            # Rows written before expiry moved to epoch seconds hold ISO strings
+            if isinstance(session_expires, str):
+                expires_at = datetime.fromisoformat(session_expires).timestamp()
+            else:
+                expires_at = session_expires
+            if expires_at < time.time():
                 return False, None
 
-            password = self._decrypt_credential(password_encrypted)
-
-            return True, {
+            user = {
                 'id': user_id,
                 'username': username,
-                'password': password,
                 'letterboxd_session': letterboxd_session
             }
+            self._cache_session(session_token, expires_at, user)
+
+            return True, dict(user)
+
+    def get_password(self, user_id: int) -> Optional[str]:
+        """Decrypt a user's Letterboxd password for the scraper.
+
+        Kept out of verify_session so session checks never decrypt.
+        """
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT password_encrypted FROM users WHERE id = ?", (user_id,))
+            result = cursor.fetchone()
+
+        if not result:
+            return None
+        return self._decrypt_credential(result[0])
 
     def logout(self, session_token: str) -> bool:
         """Logout user."""
-        with sqlite3.connect(self.db_path) as conn:
+        self._evict_session(session_token)
+
+        with self._connection() as conn:
             cursor = conn.cursor()
             cursor.execute('''
                            UPDATE users
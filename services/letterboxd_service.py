@@ -1,7 +1,8 @@
 """Service for interacting with Letterboxd"""
+import asyncio
 import re
 from bs4 import BeautifulSoup
-from typing import Optional, List, Set
+from typing import Optional, List, Set, Tuple
 from LetterboxdScraper import LetterboxdScraper
 from models.sync_models import ListInfo, GroupMember
 import logging
@@ -26,8 +27,8 @@ class LetterboxdService:
                 list_url=member.list_url
             )
 
-            # Login
-            if not scraper.login():
+            # Login, off the event loop like every other scraper call below
+            if not await asyncio.to_thread(scraper.login):
                 logger.error(f"Failed to login for member {member.display_name}")
                 return None
 
@@ -40,10 +41,10 @@ class LetterboxdService:
         """Get all lists for a user"""
         scraper = LetterboxdScraper(username, password, "https://letterboxd.com")
 
-        if not scraper.login():
+        if not await asyncio.to_thread(scraper.login):
             return []
 
-        lists = scraper.get_all_lists(username)
+        lists = await asyncio.to_thread(scraper.get_all_lists, username)
 
         return [
             ListInfo(
@@ -65,7 +66,7 @@ class LetterboxdService:
             return set()
 
         try:
-            movies = scraper.get_all_movies()
+            movies = await asyncio.to_thread(scraper.get_all_movies)
             film_ids = {movie['film_id'] for movie in movies if movie['film_id']}
             logger.info(f"Fetched {len(film_ids)} movies from {member.display_name}'s list")
             return film_ids
@@ -79,17 +80,13 @@ class LetterboxdService:
     def extract_list_id_from_page(self, scraper: LetterboxdScraper, list_url: str) -> Optional[str]:
         """Extract list ID by scraping the list page"""
         try:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            }
-
-            response = scraper.session.get(list_url, headers=headers, verify=scraper.verify_ssl)
+            # The scraper session already carries the browser headers
+            response = scraper.request("GET", list_url)
             if response.status_code != 200:
                 logger.error(f"Failed to fetch list page, status: {response.status_code}")
                 return None
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml', from_encoding='utf-8')
 
             # Method 1: Look for report link pattern
             report_span = soup.find('span', class_='report-link')
@@ -145,7 +142,7 @@ class LetterboxdService:
         if not scraper:
             return None
 
-        return self.extract_list_id_from_page(scraper, member.list_url)
+        return await asyncio.to_thread(self.extract_list_id_from_page, scraper, member.list_url)
 
     async def add_movie_to_list(self, member: GroupMember, film_id: str, list_id: str) -> bool:
         """Add a movie to a member's list"""
@@ -153,7 +150,7 @@ class LetterboxdService:
         if not scraper:
             return False
 
-        return scraper.add_movie(film_id, list_id)
+        return await asyncio.to_thread(scraper.add_movie, film_id, list_id)
 
     async def remove_movie_from_list(self, member: GroupMember, film_id: str) -> bool:
         """Remove a movie from a member's list"""
@@ -161,7 +158,25 @@ class LetterboxdService:
         if not scraper:
             return False
 
-        return scraper.remove_movie(film_id)
+        return await asyncio.to_thread(scraper.remove_movie, film_id)
+
+    async def add_movies_to_list(self, member: GroupMember, film_ids: List[str], list_id: str) -> List[Tuple[str, bool]]:
+        """Add several movies to a member's list concurrently; (film_id, success) pairs"""
+        scraper = await self.get_scraper_for_member(member)
+        if not scraper:
+            return [(film_id, False) for film_id in film_ids]
+
+        results = await asyncio.to_thread(scraper.add_movies_bulk, [(film_id, list_id) for film_id in film_ids])
+        return list(zip(film_ids, results))
+
+    async def remove_movies_from_list(self, member: GroupMember, film_ids: List[str]) -> List[Tuple[str, bool]]:
+        """Remove several movies from a member's list concurrently; (film_id, success) pairs"""
+        scraper = await self.get_scraper_for_member(member)
+        if not scraper:
+            return [(film_id, False) for film_id in film_ids]
+
+        results = await asyncio.to_thread(scraper.remove_movies_bulk, film_ids)
+        return list(zip(film_ids, results))
 
     def clear_scraper_cache(self):
         """Clear all cached scrapers"""
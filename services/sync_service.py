@@ -32,14 +32,14 @@ class SyncService:
         list_id = await self.letterboxd_service.get_list_id_for_member(member)
         if list_id:
             self.list_id_cache[member.id] = list_id
-            self.db.update_member_list_id(member.id, list_id)
+            await asyncio.to_thread(self.db.update_member_list_id, member.id, list_id)
             member.list_id = list_id  # Update the object
 
         return list_id
 
     async def sync_master_slave_group(self, group: SyncGroup) -> SyncResult:
         """Sync a master-slave group"""
-        members = self.db.get_group_members(group.id)
+        members = await asyncio.to_thread(self.db.get_group_members, group.id)
         if not members:
             return SyncResult(success=False, group_id=group.id, errors=["No members found"])
 
@@ -58,8 +58,7 @@ class SyncService:
                               errors=[f"Could not fetch movies from master {master.display_name}"])
 
         # Update master's state in DB
-        for film_id in master_movies:
-            self.db.update_user_movie_state(master.id, film_id, True)
+        await asyncio.to_thread(self.db.update_user_movie_states, master.id, master_movies, True)
 
         result = SyncResult(success=True, group_id=group.id)
 
@@ -81,38 +80,44 @@ class SyncService:
 
                 logger.info(f"Slave {slave.display_name}: +{len(movies_to_add)}, -{len(movies_to_remove)}")
 
-                # Add missing movies
-                for film_id in movies_to_add:
-                    success = await self.letterboxd_service.add_movie_to_list(slave, film_id, list_id)
+                # Add missing movies, several requests at a time
+                added = await self.letterboxd_service.add_movies_to_list(slave, list(movies_to_add), list_id)
+                succeeded = [film_id for film_id, success in added if success]
+                await asyncio.to_thread(self.db.update_user_movie_states, slave.id, succeeded, True)
+                for film_id, success in added:
                     if success:
-                        self.db.update_user_movie_state(slave.id, film_id, True)
-                        self.db.log_sync_operation(
+                        await asyncio.to_thread(
+                            self.db.log_sync_operation,
                             group.id, OperationType.ADD_MOVIE, film_id,
                             master.id, slave.id, True
                         )
                         result.operations.append(f"Added {film_id} to {slave.display_name}")
                         result.operations_count += 1
                     else:
-                        self.db.log_sync_operation(
+                        await asyncio.to_thread(
+                            self.db.log_sync_operation,
                             group.id, OperationType.ADD_MOVIE, film_id,
                             master.id, slave.id, False, "Add operation failed"
                         )
                         result.errors.append(f"Failed to add {film_id} to {slave.display_name}")
                         result.errors_count += 1
 
-                # Remove extra movies
-                for film_id in movies_to_remove:
-                    success = await self.letterboxd_service.remove_movie_from_list(slave, film_id)
+                # Remove extra movies, several requests at a time
+                removed = await self.letterboxd_service.remove_movies_from_list(slave, list(movies_to_remove))
+                succeeded = [film_id for film_id, success in removed if success]
+                await asyncio.to_thread(self.db.update_user_movie_states, slave.id, succeeded, False)
+                for film_id, success in removed:
                     if success:
-                        self.db.update_user_movie_state(slave.id, film_id, False)
-                        self.db.log_sync_operation(
+                        await asyncio.to_thread(
+                            self.db.log_sync_operation,
                             group.id, OperationType.REMOVE_MOVIE, film_id,
                             master.id, slave.id, True
                         )
                         result.operations.append(f"Removed {film_id} from {slave.display_name}")
                         result.operations_count += 1
                     else:
-                        self.db.log_sync_operation(
+                        await asyncio.to_thread(
+                            self.db.log_sync_operation,
                             group.id, OperationType.REMOVE_MOVIE, film_id,
                             master.id, slave.id, False, "Remove operation failed"
                         )
@@ -124,12 +129,12 @@ class SyncService:
                 result.errors.append(f"Error syncing {slave.display_name}: {str(e)}")
                 result.errors_count += 1
 
-        self.db.update_last_sync(group.id)
+        await asyncio.to_thread(self.db.update_last_sync, group.id)
         return result
 
     async def sync_collaborative_group(self, group: SyncGroup) -> SyncResult:
         """Sync a collaborative group"""
-        members = self.db.get_group_members(group.id)
+        members = await asyncio.to_thread(self.db.get_group_members, group.id)
         if not members:
             return SyncResult(success=False, group_id=group.id, errors=["No members found"])
 
@@ -145,8 +150,7 @@ class SyncService:
             all_movies.update(current_movies)
 
             # Update member's state in DB
-            for film_id in current_movies:
-                self.db.update_user_movie_state(member.id, film_id, True)
+            await asyncio.to_thread(self.db.update_user_movie_states, member.id, current_movies, True)
 
         logger.info(f"Total unique movies across all members: {len(all_movies)}")
 
@@ -166,12 +170,12 @@ class SyncService:
 
                 logger.info(f"{member.display_name} needs {len(missing_movies)} movies")
 
-                # Add missing movies
-                for film_id in missing_movies:
-                    success = await self.letterboxd_service.add_movie_to_list(member, film_id, list_id)
+                # Add missing movies, several requests at a time
+                added = await self.letterboxd_service.add_movies_to_list(member, list(missing_movies), list_id)
+                succeeded = [film_id for film_id, success in added if success]
+                await asyncio.to_thread(self.db.update_user_movie_states, member.id, succeeded, True)
+                for film_id, success in added:
                     if success:
-                        self.db.update_user_movie_state(member.id, film_id, True)
-
                         # Find who originally had this movie
                         source_member = None
                         for other_member in members:
@@ -179,7 +183,8 @@ class SyncService:
                                 source_member = other_member
                                 break
 
-                        self.db.log_sync_operation(
+                        await asyncio.to_thread(
+                            self.db.log_sync_operation,
                             group.id, OperationType.ADD_MOVIE, film_id,
                             source_member.id if source_member else None,
                             member.id, True
@@ -187,7 +192,8 @@ class SyncService:
                         result.operations.append(f"Added {film_id} to {member.display_name}")
                         result.operations_count += 1
                     else:
-                        self.db.log_sync_operation(
+                        await asyncio.to_thread(
+                            self.db.log_sync_operation,
                             group.id, OperationType.ADD_MOVIE, film_id,
                             None, member.id, False, "Add operation failed"
                         )
@@ -199,13 +205,13 @@ class SyncService:
                 result.errors.append(f"Error syncing {member.display_name}: {str(e)}")
                 result.errors_count += 1
 
-        self.db.update_last_sync(group.id)
+        await asyncio.to_thread(self.db.update_last_sync, group.id)
         return result
 
     async def sync_group(self, group_id: int) -> SyncResult:
         """Sync a single group"""
         # Get all active groups and find the one we want
-        groups = self.db.get_all_active_sync_groups()
+        groups = await asyncio.to_thread(self.db.get_all_active_sync_groups)
         group = next((g for g in groups if g.id == group_id), None)
 
         if not group:
@@ -229,7 +235,7 @@ class SyncService:
 
     async def sync_all_groups(self) -> Dict:
         """Sync all active groups"""
-        groups = self.db.get_all_active_sync_groups()
+        groups = await asyncio.to_thread(self.db.get_all_active_sync_groups)
 
         if not groups:
             return {'success': True, 'message': 'No groups to sync', 'results': []}
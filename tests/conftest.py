@@ -0,0 +1,12 @@
+"""Shared test setup."""
+import os
+import sys
+import tempfile
+
+# db_config and the services read DATABASE_PATH when first imported; point
+# them at a scratch directory so tests never touch real databases or keys
+os.environ["DATABASE_PATH"] = tempfile.mkdtemp(prefix="lbsync-tests-")
+
+_ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if _ROOT_DIR not in sys.path:
+    sys.path.insert(0, _ROOT_DIR)
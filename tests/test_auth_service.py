@@ -0,0 +1,120 @@
+"""Tests for AuthService credential encryption and session handling."""
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+import services.auth_service as auth_module
+from services.auth_service import AuthService
+
+
+class _Clock:
+    """Stands in for the time module so tests can move time forward."""
+
+    def __init__(self):
+        self.now = time.time()
+
+    def time(self):
+        return self.now
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = _Clock()
+    monkeypatch.setattr(auth_module, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    svc = AuthService(db_path=str(tmp_path / "users.db"))
+    monkeypatch.setattr(svc, "verify_letterboxd_credentials", lambda username, password: (True, "{}"))
+    return svc
+
+
+def _set_expiry(svc, token, value):
+    with svc._connection() as conn:
+        conn.execute("UPDATE users SET session_expires = ? WHERE session_token = ?", (value, token))
+        conn.commit()
+
+
+def test_credentials_round_trip_through_aes_gcm(service):
+    first = service._encrypt_credential("hunter2")
+    second = service._encrypt_credential("hunter2")
+
+    assert first.startswith(AuthService._GCM_PREFIX)
+    # Fresh nonce per call
+    assert first != second
+    assert service._decrypt_credential(first) == "hunter2"
+    assert service._decrypt_credential(second) == "hunter2"
+
+
+def test_legacy_fernet_credentials_still_decrypt(service):
+    legacy = service.cipher.encrypt("hunter2".encode()).decode()
+
+    assert not legacy.startswith(AuthService._GCM_PREFIX)
+    assert service._decrypt_credential(legacy) == "hunter2"
+
+
+def test_register_then_login(service):
+    created, token, message = service.register_or_login("bob", "pw")
+    assert created and message == "Account created successfully"
+
+    ok, user = service.verify_session(token)
+    assert ok and user["username"] == "bob"
+    assert service.get_password(user["id"]) == "pw"
+
+    ok, new_token, message = service.register_or_login("bob", "pw")
+    assert ok and message == "Login successful"
+    # The replaced token stops working at once on this instance
+    assert service.verify_session(token) == (False, None)
+    assert service.verify_session(new_token)[0]
+
+    assert service.register_or_login("bob", "wrong")[0] is False
+
+
+def test_expired_session_is_rejected(service, clock):
+    _, token, _ = service.register_or_login("bob", "pw")
+    assert service.verify_session(token)[0]
+
+    clock.now += AuthService.SESSION_LIFETIME_SECONDS + 1
+
+    assert service.verify_session(token) == (False, None)
+
+
+def test_iso_expiry_from_older_rows(service):
+    _, token, _ = service.register_or_login("bob", "pw")
+
+    _set_expiry(service, token, (datetime.now() + timedelta(days=1)).isoformat())
+    assert service.verify_session(token)[0]
+
+    service._evict_session(token)
+    _set_expiry(service, token, (datetime.now() - timedelta(days=1)).isoformat())
+    assert service.verify_session(token) == (False, None)
+
+
+def test_cached_session_is_reread_after_ttl(service, clock, tmp_path):
+    _, token, _ = service.register_or_login("bob", "pw")
+    assert service.verify_session(token)[0]
+
+    # Another worker process logs the session out; this cache can't see it yet
+    other_worker = AuthService(db_path=str(tmp_path / "users.db"))
+    assert other_worker.logout(token)
+    assert service.verify_session(token)[0]
+
+    clock.now += AuthService.SESSION_CACHE_TTL_SECONDS + 1
+
+    assert service.verify_session(token) == (False, None)
+
+
+def test_logout_evicts_cached_session(service):
+    _, token, _ = service.register_or_login("bob", "pw")
+    assert service.verify_session(token)[0]
+
+    assert service.logout(token)
+
+    assert service.verify_session(token) == (False, None)
+    assert service.verify_session("") == (False, None)
@@ -0,0 +1,125 @@
+"""Tests for ListDetailState paging and the shared list page cache."""
+import pytest
+import reflex as rx
+
+import LetterboxdSync.states.list_detail_state as detail_module
+from LetterboxdSync.states.list_detail_state import ListDetailState
+
+
+@pytest.fixture
+def state():
+    root = rx.State(_reflex_internal_init=True)
+    return root.get_substate(ListDetailState.get_full_name().split(".")[1:])
+
+
+@pytest.fixture(autouse=True)
+def empty_page_cache():
+    for shared in (detail_module._page_cache, detail_module._page_futures, detail_module._page_generations):
+        shared.clear()
+    yield
+    for shared in (detail_module._page_cache, detail_module._page_futures, detail_module._page_generations):
+        shared.clear()
+
+
+def _movies(count):
+    return [{"name": f"m{i}", "film_id": str(i)} for i in range(count)]
+
+
+@pytest.mark.parametrize("film_count, total_count, total_pages, has_more", [
+    ("1,234", 1234, 50, True),
+    ("25", 25, 1, False),
+    ("26", 26, 2, True),
+    ("0", 0, 0, False),
+])
+def test_set_list_info_page_math(state, film_count, total_count, total_pages, has_more):
+    state.set_list_info("1", "Favourites", "https://letterboxd.com/bob/list/favourites/", film_count)
+
+    assert state.total_count == total_count
+    assert state.total_pages == total_pages
+    assert state.has_more is has_more
+
+
+def test_unknown_film_count(state):
+    state.set_list_info("1", "Favourites", "https://letterboxd.com/bob/list/favourites/", "lots")
+
+    assert (state.total_count, state.total_pages, state.has_more) == (0, 0, False)
+    assert state.page_label == "Page 1"
+
+
+def test_show_page_with_known_total(state):
+    state.set_list_info("1", "Favourites", "https://letterboxd.com/bob/list/favourites/", "1,234")
+    state._movies = _movies(100)
+
+    state._show_page(4, 75)
+
+    assert state.page_label == "Page 4 of 50"
+    assert [movie["name"] for movie in state.visible_movies] == [f"m{i}" for i in range(75, 100)]
+    assert state.has_more is True
+    assert state.results_summary == "Showing 25 of 1234 movies"
+
+    state._show_page(50, 25)
+    assert state.has_more is False
+
+
+def test_show_page_with_unknown_total(state):
+    state.set_list_info("1", "Favourites", "https://letterboxd.com/bob/list/favourites/", "")
+
+    # A full Letterboxd page may have a successor
+    state._movies = _movies(state.movies_per_letterboxd_page)
+    state._show_page(4, 75)
+    assert state.has_more is True
+
+    # A short one ends the list once its last window is shown
+    state._movies = _movies(60)
+    state._show_page(2, 25)
+    assert state.has_more is True
+    state._show_page(3, 50)
+    assert state.has_more is False
+    assert state.results_summary == "Showing 10 movies"
+
+
+def test_page_cache_is_bounded_per_user():
+    for page in range(detail_module._PAGE_CACHE_SIZE + 3):
+        detail_module._store_page(("alice", "list-a", page), _movies(1))
+    detail_module._store_page(("bob", "list-b", 1), _movies(1))
+
+    assert len(detail_module._page_cache["alice"]) == detail_module._PAGE_CACHE_SIZE
+    # The oldest of alice's pages went first; bob's page is untouched
+    assert detail_module._cached_page(("alice", "list-a", 0)) == (None, None)
+    assert detail_module._cached_page(("alice", "list-a", 7)) == (_movies(1), None)
+    assert detail_module._cached_page(("bob", "list-b", 1)) == (_movies(1), None)
+
+
+def test_drop_cached_pages_for_one_list():
+    detail_module._store_page(("alice", "list-a", 1), _movies(1))
+    detail_module._store_page(("alice", "list-b", 1), _movies(2))
+
+    detail_module._drop_cached_pages("alice", "list-a")
+
+    assert detail_module._cached_page(("alice", "list-a", 1)) == (None, None)
+    assert detail_module._cached_page(("alice", "list-b", 1)) == (_movies(2), None)
+
+
+def test_fetch_started_before_invalidation_is_not_cached():
+    generation = detail_module._page_generations.get("alice", 0)
+
+    # A sync lands while the page is being fetched
+    detail_module._drop_cached_pages("alice", "list-a")
+    detail_module._store_page(("alice", "list-a", 1), _movies(1), generation)
+    assert detail_module._cached_page(("alice", "list-a", 1)) == (None, None)
+
+    # A fetch under the current generation is kept
+    current = detail_module._page_generations["alice"]
+    detail_module._store_page(("alice", "list-a", 1), _movies(1), current)
+    assert detail_module._cached_page(("alice", "list-a", 1)) == (_movies(1), None)
+
+
+def test_expired_pages_are_dropped():
+    detail_module._store_page(("alice", "list-a", 1), _movies(1))
+    fetched_at, movies = detail_module._page_cache["alice"][("alice", "list-a", 1)]
+    detail_module._page_cache["alice"][("alice", "list-a", 1)] = (
+        fetched_at - detail_module._PAGE_CACHE_TTL_SECONDS - 1, movies
+    )
+
+    assert detail_module._cached_page(("alice", "list-a", 1)) == (None, None)
+    assert ("alice", "list-a", 1) not in detail_module._page_cache["alice"]
@@ -0,0 +1,148 @@
+"""Tests for the LetterboxdScraper HTML parsing and page cache."""
+import pytest
+
+from LetterboxdScraper import LetterboxdScraper
+
+LIST_URL = "https://letterboxd.com/bob/list/favourites/"
+
+
+def _movie_li(film_id, rating=None):
+    rating_attr = f' data-owner-rating="{rating}"' if rating is not None else ""
+    return (
+        f'<li class="posteritem numbered-list-item"{rating_attr} data-object-id="film:{film_id}">'
+        f'<div class="react-component poster" data-item-name="Movie {film_id} — Amélie" '
+        f'data-item-slug="movie-{film_id}" data-film-id="{film_id}" '
+        f'data-item-link="/film/movie-{film_id}/" data-poster-url="/p/{film_id}.jpg"></div></li>'
+    )
+
+
+def _movies_page(items, next_page=None, last_page=None):
+    paginator = ""
+    if last_page:
+        paginator = '<div class="paginate-pages"><ul>' + "".join(
+            f'<li class="paginate-page"><a href="/page/{n}/">{n}</a></li>' for n in range(1, last_page + 1)
+        ) + '<li class="paginate-page unseen-pages">…</li></ul></div>'
+    next_link = f'<a class="next" href="/page/{next_page}/">Next</a>' if next_page else ""
+    return f'<html><body><ul class="poster-list">{"".join(items)}</ul>{paginator}{next_link}</body></html>'
+
+
+class _Response:
+    def __init__(self, status_code, body="", headers=None):
+        self.status_code = status_code
+        self.content = body.encode("utf-8")
+        self.headers = headers or {}
+
+
+@pytest.fixture
+def scraper():
+    return LetterboxdScraper("bob", "secret", LIST_URL)
+
+
+def test_parse_movies_reads_every_field(scraper):
+    movies = scraper.parse_movies(_movies_page([_movie_li(7, rating=8)]))
+
+    assert movies == [{
+        "name": "Movie 7 — Amélie",
+        "slug": "movie-7",
+        "film_id": "7",
+        "link": "/film/movie-7/",
+        "rating": "8",
+        "poster_url": "/p/7.jpg",
+        "object_id": "film:7",
+    }]
+
+
+def test_parse_movies_accepts_bytes_and_keeps_order(scraper):
+    html = _movies_page([_movie_li(i) for i in (3, 1, 2)]).encode("utf-8")
+
+    movies = scraper.parse_movies(html)
+
+    assert [movie["film_id"] for movie in movies] == ["3", "1", "2"]
+    # Non-ASCII names survive the UTF-8 fast path
+    assert movies[0]["name"] == "Movie 3 — Amélie"
+
+
+def test_parse_movies_unrated_and_malformed_items(scraper):
+    bare_item = '<li class="posteritem"><span>no poster</span></li>'
+
+    movies = scraper.parse_movies(_movies_page([_movie_li(1), bare_item]))
+
+    assert len(movies) == 1
+    assert movies[0]["rating"] is None
+
+
+def test_parse_movies_empty_body(scraper):
+    assert scraper.parse_movies(b"") == []
+    assert scraper.has_next_page("") is False
+
+
+def test_pagination_markers(scraper):
+    tree = scraper._parse_html(_movies_page([_movie_li(1)], next_page=2, last_page=4))
+
+    assert scraper.has_next_page(tree) is True
+    assert scraper._discover_last_page(tree) == 4
+    assert scraper._discover_last_page(scraper._parse_html(_movies_page([]))) is None
+
+
+def test_parse_lists(scraper):
+    long_notes = "x" * 200
+    html = (
+        '<html><body>'
+        '<article class="list-summary" data-film-list-id="42">'
+        '<h2 class="name"><a href="/bob/list/favourites/">Favourites</a></h2>'
+        '<div class="content-reactions-strip"><span class="value">1,234\xa0films</span></div>'
+        f'<div class="notes"><p>{long_notes}</p></div>'
+        '</article>'
+        '<article class="list-summary" data-film-list-id="43">'
+        '<h2 class="name"><a href="/bob/list/one/">One</a></h2>'
+        '<div class="content-reactions-strip"><span class="value">1 film</span></div>'
+        '</article>'
+        '<article class="list-summary"><p>missing name link</p></article>'
+        '</body></html>'
+    )
+
+    lists = scraper.parse_lists(html, "bob")
+
+    assert [item["id"] for item in lists] == ["42", "43"]
+    favourites, one = lists
+    assert favourites["slug"] == "favourites"
+    assert favourites["url"] == "https://letterboxd.com/bob/list/favourites/"
+    assert favourites["film_count"] == "1,234"
+    assert favourites["description"] == "x" * 147 + "..."
+    assert favourites["owner"] == "bob"
+    assert one["film_count"] == "1"
+    assert one["description"] == ""
+
+
+def test_fetch_page_revalidates_with_etag(scraper):
+    sent_headers = []
+    responses = [
+        _Response(200, _movies_page([_movie_li(1), _movie_li(2)], next_page=2), {"ETag": '"v1"'}),
+        _Response(304),
+    ]
+
+    def fake_request(method, url, headers=None, **kwargs):
+        sent_headers.append(dict(headers or {}))
+        return responses.pop(0)
+
+    scraper.session.request = fake_request
+    url = scraper._movies_page_url(1)
+
+    first = scraper._fetch_page(url, 1, LIST_URL, scraper.iter_movies)
+    second = scraper._fetch_page(url, 1, LIST_URL, scraper.iter_movies)
+
+    assert "If-None-Match" not in sent_headers[0]
+    assert sent_headers[1]["If-None-Match"] == '"v1"'
+    assert second is first
+    items, has_next, last_page = first
+    assert [movie["film_id"] for movie in items] == ["1", "2"]
+    assert has_next is True
+    assert last_page is None
+
+
+def test_for_list_shares_session_and_page_cache(scraper):
+    other = scraper.for_list("https://letterboxd.com/bob/list/other/")
+
+    assert other.session is scraper.session
+    assert other._page_cache is scraper._page_cache
+    assert other.list_url == "https://letterboxd.com/bob/list/other"